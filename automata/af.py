@@ -1,7 +1,27 @@
 from abc import ABC, abstractmethod
-from typing import Set, Dict, Any
+from collections import deque
+from types import MappingProxyType
+from typing import Set, Dict, Any, List, Iterable, Iterator, Sequence, FrozenSet, Mapping, Tuple
+
 
 class AF(ABC):
+    """
+    Classe base para autômatos finitos.
+
+    Estados e símbolos são internados em tabelas de inteiros: ``states[i]`` é o
+    rótulo do estado ``i`` e ``state_index`` faz o caminho inverso (o mesmo vale
+    para ``symbols``/``symbol_index``). As subclasses guardam as transições em
+    arrays planos indexados por esses inteiros. ``Q``, ``Sigma``, ``delta``,
+    ``q0`` e ``F`` continuam disponíveis como visões imutáveis construídas sob
+    demanda (``frozenset`` e ``MappingProxyType``): alterá-las levanta erro em
+    vez de ser ignorado pelas tabelas.
+    """
+
+    __slots__ = (
+        'states', 'symbols', 'symbol_index', 'start', 'finals',
+        '_state_index', '_Q', '_Sigma', '_F', '_delta',
+    )
+
     def __init__(
         self,
         Q: Set[Any],  # Pode ser Set[str] ou Set[Set[str]] dependendo da subclasse
@@ -10,8 +30,152 @@ class AF(ABC):
         q0: Any,  # Pode ser str ou Set[str]
         F: Set[Any]  # Pode ser Set[str] ou Set[Set[str]]
     ):
-        self.Q = Q
-        self.Sigma = Sigma
-        self.delta = delta
-        self.q0 = q0
-        self.F = F
\ No newline at end of file
+        # Estados citados em q0, F ou delta mas ausentes de Q também são internados
+        extra = ({q0} | set(F) | set(self._delta_states(delta))) - set(Q)
+        self.states = tuple(self._order_states(Q)) + tuple(self._order_states(extra))
+        self._state_index = {state: i for i, state in enumerate(self.states)}
+
+        self.symbols = tuple(sorted(set(Sigma) | set(self._delta_symbols(delta))))
+        self.symbol_index = {symbol: i for i, symbol in enumerate(self.symbols)}
+
+        self.start = self.state_index[q0]
+        self.finals = bytearray(len(self.states))
+        for state in F:
+            self.finals[self.state_index[state]] = 1
+
+        self._Q = None
+        self._Sigma = None
+        self._F = None
+        self._delta = None
+        self._compile_delta(delta)
+
+    @classmethod
+    def _from_tables(cls, states: Sequence[Any], symbols: tuple, start: int, finals: bytearray):
+        """
+        Cria uma instância diretamente a partir das tabelas internadas, sem
+        passar pelas visões em dicionário. As subclasses completam as transições.
+        """
+        obj = cls.__new__(cls)
+        obj.states = states
+        obj._state_index = None
+        obj.symbols = symbols
+        obj.symbol_index = {symbol: i for i, symbol in enumerate(symbols)}
+        obj.start = start
+        obj.finals = finals
+        obj._Q = None
+        obj._Sigma = None
+        obj._F = None
+        obj._delta = None
+        return obj
+
+    # Visões construídas sob demanda: não são serializadas (o MappingProxyType
+    # de delta nem pode ser) e são refeitas após desserializar
+    _CACHED = ('_state_index', '_Q', '_Sigma', '_F', '_delta')
+
+    def __getstate__(self) -> Dict[str, Any]:
+        state = {}
+        for cls in type(self).__mro__:
+            for slot in cls.__dict__.get('__slots__', ()):
+                if slot not in self._CACHED and hasattr(self, slot):
+                    state[slot] = getattr(self, slot)
+        return state
+
+    def __setstate__(self, state: Dict[str, Any]):
+        for slot in self._CACHED:
+            setattr(self, slot, None)
+        for slot, value in state.items():
+            setattr(self, slot, value)
+
+    @staticmethod
+    def _order_states(states: Iterable[Any]) -> List[Any]:
+        """
+        Ordem determinística dos estados na tabela de internação. Rótulos que
+        não são comparáveis entre si (ex.: ``'S'`` e ``1``) são ordenados pela
+        representação.
+        """
+        states = list(states)
+        try:
+            return sorted(states)
+        except TypeError:
+            return sorted(states, key=repr)
+
+    @staticmethod
+    @abstractmethod
+    def _delta_states(delta: Dict) -> Iterable[Any]:
+        """Estados que aparecem na função de transição em formato de dicionário."""
+
+    @staticmethod
+    @abstractmethod
+    def _delta_symbols(delta: Dict) -> Iterable[str]:
+        """Símbolos que aparecem na função de transição (exceto ε)."""
+
+    @abstractmethod
+    def _compile_delta(self, delta: Dict):
+        """Converte a função de transição em dicionário para os arrays internos."""
+
+    @abstractmethod
+    def _build_delta(self) -> Dict:
+        """Reconstrói a função de transição em dicionário a partir dos arrays."""
+
+    @abstractmethod
+    def edges(self, state: int) -> Iterator[Tuple[int, int]]:
+        """Transições ``(símbolo, destino)`` que saem de ``state``, em índices internados."""
+
+    def distance_to_final(self) -> List[int]:
+        """
+        Menor número de transições para alcançar um estado final a partir de
+        cada estado (-1 para estados mortos, dos quais nenhum final é
+        alcançável), via busca em largura sobre as transições invertidas.
+        """
+        predecessors = [[] for _ in range(len(self.states))]
+        for q in range(len(self.states)):
+            for _, target in self.edges(q):
+                predecessors[target].append(q)
+
+        distance = [-1] * len(self.states)
+        queue = deque(q for q, final in enumerate(self.finals) if final)
+        for q in queue:
+            distance[q] = 0
+        while queue:
+            state = queue.popleft()
+            for source in predecessors[state]:
+                if distance[source] < 0:
+                    distance[source] = distance[state] + 1
+                    queue.append(source)
+        return distance
+
+    @property
+    def state_index(self) -> Dict[Any, int]:
+        """Índice inverso rótulo -> inteiro, construído sob demanda."""
+        if self._state_index is None:
+            self._state_index = {state: i for i, state in enumerate(self.states)}
+        return self._state_index
+
+    @property
+    def Q(self) -> FrozenSet[Any]:
+        if self._Q is None:
+            self._Q = frozenset(self.states)
+        return self._Q
+
+    @property
+    def Sigma(self) -> FrozenSet[str]:
+        if self._Sigma is None:
+            self._Sigma = frozenset(self.symbols)
+        return self._Sigma
+
+    @property
+    def q0(self) -> Any:
+        return self.states[self.start]
+
+    @property
+    def F(self) -> FrozenSet[Any]:
+        if self._F is None:
+            self._F = frozenset(self.states[i] for i, final in enumerate(self.finals) if final)
+        return self._F
+
+    @property
+    def delta(self) -> Mapping:
+        """Visão em dicionário da função de transição (somente leitura)."""
+        if self._delta is None:
+            self._delta = MappingProxyType(self._build_delta())
+        return self._delta
@@ -1,8 +1,19 @@
+from array import array
 from .af import AF
 from .formatter import AutomataFormatter
-from typing import Dict, Set, Tuple, FrozenSet
+from typing import Dict, Set, Tuple, FrozenSet, Iterable, Iterator, List, Optional
 
 class AFD(AF):
+    """
+    Autômato Finito Determinístico.
+
+    As transições ficam numa tabela densa ``table`` (``array('i')``) de
+    ``len(states) * len(symbols)`` posições: o destino do estado ``q`` pelo
+    símbolo ``a`` é ``table[q * len(symbols) + a]``, ou -1 se indefinido.
+    """
+
+    __slots__ = ('table',)
+
     def __init__(
         self,
         Q: Set[FrozenSet[str]],  # Estados compostos como conjuntos imutáveis
@@ -15,6 +26,58 @@ class AFD(AF):
     
     def __repr__(self):
         return AutomataFormatter.format_afd(self)
+
+    @staticmethod
+    def _order_states(states: Iterable[FrozenSet[str]]) -> List[FrozenSet[str]]:
+        states = list(states)
+        try:
+            return sorted(states, key=lambda s: ",".join(sorted(s)))
+        except TypeError:
+            return sorted(states, key=lambda s: sorted(repr(x) for x in s))
+
+    @staticmethod
+    def _delta_states(delta: Dict) -> Iterable[FrozenSet[str]]:
+        for (state, _), target in delta.items():
+            yield state
+            yield target
+
+    @staticmethod
+    def _delta_symbols(delta: Dict) -> Iterable[str]:
+        for (_, symbol) in delta:
+            yield symbol
+
+    def _compile_delta(self, delta: Dict):
+        k = len(self.symbols)
+        self.table = array('i', [-1]) * (len(self.states) * k)
+        for (state, symbol), target in delta.items():
+            self.table[self.state_index[state] * k + self.symbol_index[symbol]] = self.state_index[target]
+
+    def _build_delta(self) -> Dict[Tuple[FrozenSet[str], str], FrozenSet[str]]:
+        k = len(self.symbols)
+        delta = {}
+        for q, state in enumerate(self.states):
+            for a, symbol in enumerate(self.symbols):
+                target = self.table[q * k + a]
+                if target >= 0:
+                    delta[(state, symbol)] = self.states[target]
+        return delta
+
+    def edges(self, state: int) -> Iterator[Tuple[int, int]]:
+        k = len(self.symbols)
+        for a, target in enumerate(self.table[state * k:(state + 1) * k]):
+            if target >= 0:
+                yield a, target
+
+    @classmethod
+    def from_table(cls, states: tuple, symbols: tuple, table: array,
+                   start: int, finals: bytearray) -> 'AFD':
+        """
+        Cria um AFD diretamente a partir das tabelas internadas (a tabela de
+        transições é compartilhada, não copiada).
+        """
+        afd = cls._from_tables(states, symbols, start, finals)
+        afd.table = table
+        return afd
     
     def simulate(self, input_string: str, verbose=True) -> bool:
         """
@@ -27,7 +90,8 @@ class AFD(AF):
         Returns:
             bool: True se a cadeia é aceita, False caso contrário
         """
-        current_state = self.q0
+        current = self.start
+        current_state = self.states[current]
         
         if verbose:
             if input_string == "":
@@ -43,44 +107,48 @@ class AFD(AF):
                 print(f"Permanece no estado inicial: {{{','.join(sorted(current_state))}}}")
             
             # Para cadeia épsilon, verificamos se o estado inicial é final
-            is_accepted = current_state in self.F
+            is_accepted = bool(self.finals[current])
             
             if verbose:
                 print(f"Estado inicial é final? {'Sim' if is_accepted else 'Não'}")
             
             return is_accepted
         
+        table = self.table
+        symbol_index = self.symbol_index
+        k = len(self.symbols)
+        
         # Processar cada símbolo da cadeia (caso normal)
         for i, symbol in enumerate(input_string):
             if verbose:
                 print(f"Passo {i+1}: Lendo símbolo '{symbol}'")
             
             # Verificar se o símbolo está no alfabeto
-            if symbol not in self.Sigma:
+            a = symbol_index.get(symbol)
+            if a is None:
                 if verbose:
                     print(f"  ERRO: Símbolo '{symbol}' não está no alfabeto {{{','.join(sorted(self.Sigma))}}}")
                 return False
             
             # Buscar transição
-            transition_key = (current_state, symbol)
-            if transition_key in self.delta:
-                next_state = self.delta[transition_key]
+            next_id = table[current * k + a]
+            if next_id >= 0:
                 if verbose:
-                    current_str = "{" + ",".join(sorted(current_state)) + "}"
-                    next_str = "{" + ",".join(sorted(next_state)) + "}"
+                    current_str = "{" + ",".join(sorted(self.states[current])) + "}"
+                    next_str = "{" + ",".join(sorted(self.states[next_id])) + "}"
                     print(f"  {current_str} --{symbol}--> {next_str}")
-                current_state = next_state
+                current = next_id
             else:
                 if verbose:
-                    current_str = "{" + ",".join(sorted(current_state)) + "}"
+                    current_str = "{" + ",".join(sorted(self.states[current])) + "}"
                     print(f"  ERRO: Não há transição de {current_str} com símbolo '{symbol}'")
                 return False
         
         # Verificar se o estado final é de aceitação
-        is_accepted = current_state in self.F
+        is_accepted = bool(self.finals[current])
         
         if verbose:
-            final_str = "{" + ",".join(sorted(current_state)) + "}"
+            final_str = "{" + ",".join(sorted(self.states[current])) + "}"
             print(f"Estado final: {final_str}")
             print(f"Estado final é de aceitação? {'Sim' if is_accepted else 'Não'}")
         
@@ -98,6 +166,149 @@ class AFD(AF):
         """
         return self.simulate(input_string, verbose=False)
     
+    def simulate_parallel(self, input_string: str, processes=None, chunk_size=None) -> bool:
+        """
+        Simula uma cadeia muito longa usando vários processos, sem prints.
+        
+        A cadeia é dividida em blocos; cada processo calcula o mapeamento
+        estado -> estado do seu bloco a partir de todos os estados, e os
+        mapeamentos são combinados em ordem a partir do estado inicial.
+        
+        Args:
+            input_string: A cadeia a ser testada
+            processes: Número de processos (padrão: número de CPUs)
+            chunk_size: Tamanho de cada bloco em símbolos
+            
+        Returns:
+            bool: True se a cadeia é aceita, False caso contrário
+        """
+        from .parallel import simulate_parallel, DEFAULT_CHUNK_SIZE
+        
+        return simulate_parallel(self, input_string, processes, chunk_size or DEFAULT_CHUNK_SIZE)
+    
+    def count_strings(self, n: int, modulus: Optional[int] = None) -> int:
+        """
+        Conta as cadeias de comprimento exatamente ``n`` aceitas pelo AFD.
+        
+        Programação dinâmica sobre a tabela compilada: ``w[q]`` é o número de
+        cadeias de comprimento ``i`` aceitas a partir de ``q``. Apenas estados
+        alcançáveis e não mortos participam. Com ``modulus`` e ``n`` grande em
+        relação ao número de estados, a matriz de transição é elevada à
+        potência ``n`` por quadrados sucessivos (O(s³ log n)) em vez das ``n``
+        iterações. Sem ``modulus`` os valores crescem até O(n) bits e as s³
+        multiplicações de inteiros grandes por quadrado custam mais que as
+        somas da iteração linear, então a potência não é usada.
+        
+        Args:
+            n: Comprimento das cadeias
+            modulus: Se informado, o resultado é calculado módulo esse valor
+                (inteiros de precisão arbitrária caso contrário)
+            
+        Returns:
+            int: Número de cadeias aceitas de comprimento ``n``
+        """
+        if n < 0:
+            raise ValueError("O comprimento deve ser não negativo.")
+        
+        k = len(self.symbols)
+        distance = self.distance_to_final()
+        if distance[self.start] < 0:
+            return 0
+        
+        # Estados úteis: alcançáveis a partir do inicial e não mortos
+        useful = []
+        seen = {self.start}
+        stack = [self.start]
+        while stack:
+            state = stack.pop()
+            useful.append(state)
+            for a in range(k):
+                target = self.table[state * k + a]
+                if target >= 0 and distance[target] >= 0 and target not in seen:
+                    seen.add(target)
+                    stack.append(target)
+        index = {state: i for i, state in enumerate(useful)}
+        
+        # rows[i]: destinos (índices em useful) de cada transição útil de useful[i]
+        rows = []
+        for state in useful:
+            row = []
+            for a in range(k):
+                target = self.table[state * k + a]
+                if target in index:
+                    row.append(index[target])
+            rows.append(row)
+        
+        def reduce(value):
+            return value % modulus if modulus else value
+        
+        s = len(useful)
+        finals = [reduce(self.finals[state]) for state in useful]
+        
+        if modulus and s * s * max(n.bit_length(), 1) < n * max(k, 1):
+            # Potência da matriz de contagem por quadrados sucessivos
+            matrix = [[0] * s for _ in range(s)]
+            for i, row in enumerate(rows):
+                for j in row:
+                    matrix[i][j] += 1
+            vector = finals
+            while n:
+                if n & 1:
+                    vector = [reduce(sum(m * v for m, v in zip(line, vector))) for line in matrix]
+                n >>= 1
+                if n:
+                    columns = list(zip(*matrix))
+                    matrix = [[reduce(sum(x * y for x, y in zip(line, column))) for column in columns]
+                              for line in matrix]
+            return vector[0]
+        
+        vector = finals
+        for _ in range(n):
+            vector = [reduce(sum(vector[j] for j in row)) for row in rows]
+        return vector[0]
+    
+    def enumerate(self, n: int) -> Iterator[str]:
+        """
+        Gera, sob demanda, as cadeias aceitas de comprimento até ``n``, em
+        ordem de comprimento e, dentro de cada comprimento, na ordem do
+        alfabeto.
+        
+        Cada comprimento é percorrido em profundidade (memória O(n)), e um
+        prefixo é podado assim que o estado corrente não consegue alcançar
+        um estado final com os símbolos restantes.
+        """
+        k = len(self.symbols)
+        table = self.table
+        distance = self.distance_to_final()
+        
+        for length in range(n + 1):
+            if distance[self.start] < 0 or distance[self.start] > length:
+                continue
+            if length == 0:
+                yield ""
+                continue
+            
+            # Pilha de (estado, próximo símbolo a tentar); prefix guarda os símbolos lidos
+            prefix = []
+            stack = [(self.start, 0)]
+            while stack:
+                state, a = stack.pop()
+                if a == k:
+                    if prefix:
+                        prefix.pop()
+                    continue
+                stack.append((state, a + 1))
+                target = table[state * k + a]
+                remaining = length - len(prefix) - 1
+                if target < 0 or distance[target] < 0 or distance[target] > remaining:
+                    continue
+                if remaining == 0:
+                    # distance[target] == 0: o estado é final
+                    yield "".join(prefix) + self.symbols[a]
+                    continue
+                prefix.append(self.symbols[a])
+                stack.append((target, 0))
+    
     def print_transition_table(self):
         AutomataFormatter.print_afd_transition_table(self)
 
@@ -107,15 +318,10 @@ class AFD(AF):
         Estados finais se tornam não-finais e vice-versa.
         """
         # Novos estados finais são todos os estados que não são finais no AFD original
-        new_accept_states = {state for state in self.Q if state not in self.F}
+        new_finals = bytearray(1 - final for final in self.finals)
         
-        return AFD(
-            Q=self.Q.copy(),
-            Sigma=self.Sigma.copy(),
-            delta=self.delta.copy(),
-            q0=self.q0,
-            F=new_accept_states
-        )
+        # A tabela de transições é imutável e pode ser compartilhada
+        return AFD.from_table(self.states, self.symbols, self.table, self.start, new_finals)
     
     def apply_complement_verbose(self):
         """
@@ -151,9 +357,12 @@ class AFD(AF):
         
         return complement_afd
     
-    def apply_reverse(self):
+    def apply_reverse(self, verbose=True):
         """
         Aplica a operação de reverso no AFD e retorna um AFD determinizado.
+        
+        Args:
+            verbose: Se True, exibe a tabela de determinização do AFN reverso
         """
         from .afn import AFN  # Import local para evitar circulares
         from automata.converter import Converter  # Import absoluto (não relativo)
@@ -171,10 +380,15 @@ class AFD(AF):
         new_states.add(new_initial_state)
         new_delta = {}
         
-        # Inverter transições
-        for (source_state, symbol), target_state in self.delta.items():
-            source_name = state_mapping[target_state]  # Inverter: destino vira origem
-            target_name = state_mapping[source_state]  # Inverter: origem vira destino
+        # Inverter transições (percorrendo a tabela compilada)
+        k = len(self.symbols)
+        for index, target in enumerate(self.table):
+            if target < 0:
+                continue
+            source, a = divmod(index, k)
+            symbol = self.symbols[a]
+            source_name = state_mapping[self.states[target]]  # Inverter: destino vira origem
+            target_name = state_mapping[self.states[source]]  # Inverter: origem vira destino
             
             if source_name not in new_delta:
                 new_delta[source_name] = {}
@@ -204,7 +418,7 @@ class AFD(AF):
         
         # Determinizar o AFN para obter AFD
         converter = Converter({})  # Converter vazio só para usar o método
-        afd_reverse = converter.convert_afn_to_afd(afn_reverse)
+        afd_reverse = converter.convert_afn_to_afd(afn_reverse, verbose=verbose)
         
         return afd_reverse
 
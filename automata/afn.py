@@ -1,9 +1,22 @@
-from typing import Set, Dict
+from array import array
+from types import MappingProxyType
+from typing import Set, Dict, Iterable, Iterator, List, Mapping, FrozenSet, Tuple
 from .af import AF
 from .formatter import AutomataFormatter
 
 
 class AFN(AF):
+    """
+    Autômato Finito Não-Determinístico.
+
+    As transições ficam em arrays planos por símbolo (formato CSR): os destinos
+    do estado ``q`` pelo símbolo ``a`` são
+    ``targets[a][offsets[a][q]:offsets[a][q + 1]]``. As transições ε ocupam o
+    índice ``epsilon_id`` (logo após o último símbolo de ``symbols``).
+    """
+
+    __slots__ = ('offsets', 'targets')
+
     def __init__(
         self,
         Q: Set[str],
@@ -16,6 +29,132 @@ class AFN(AF):
 
     def __repr__(self):
         return AutomataFormatter.format_afn(self)
+
+    @staticmethod
+    def _delta_states(delta: Dict) -> Iterable[str]:
+        for state, trans in delta.items():
+            yield state
+            for targets in trans.values():
+                yield from targets
+
+    @staticmethod
+    def _delta_symbols(delta: Dict) -> Iterable[str]:
+        for trans in delta.values():
+            for symbol in trans:
+                if symbol != '':
+                    yield symbol
+
+    @property
+    def epsilon_id(self) -> int:
+        return len(self.symbols)
+
+    def _compile_delta(self, delta: Dict):
+        # Adjacência temporária por símbolo, descartada após compactar
+        adjacency = [{} for _ in range(len(self.symbols) + 1)]
+        for state, trans in delta.items():
+            q = self.state_index[state]
+            for symbol, targets in trans.items():
+                a = self.epsilon_id if symbol == '' else self.symbol_index[symbol]
+                adjacency[a].setdefault(q, []).extend(sorted(self.state_index[t] for t in targets))
+        self._set_transitions(adjacency)
+
+    def _set_transitions(self, adjacency: List[Dict[int, List[int]]]):
+        """Compacta a adjacência ``adjacency[a][q] -> [destinos]`` nos arrays CSR."""
+        self.offsets = []
+        self.targets = []
+        for rows in adjacency:
+            offsets = array('i', [0])
+            targets = array('i')
+            for q in range(len(self.states)):
+                row = rows.get(q)
+                if row:
+                    targets.extend(row)
+                offsets.append(len(targets))
+            self.offsets.append(offsets)
+            self.targets.append(targets)
+
+    @classmethod
+    def from_adjacency(cls, states: tuple, symbols: tuple, adjacency: List[Dict[int, List[int]]],
+                       start: int, finals: Iterable[int]) -> 'AFN':
+        """
+        Cria um AFN diretamente a partir da adjacência sobre índices inteiros
+        (``adjacency[a][q] -> [destinos]``, com ε no índice ``len(symbols)``),
+        sem passar pela função de transição em dicionário.
+        """
+        flags = bytearray(len(states))
+        for q in finals:
+            flags[q] = 1
+        afn = cls._from_tables(tuple(states), tuple(symbols), start, flags)
+        afn._set_transitions(adjacency)
+        return afn
+
+    def _build_delta(self) -> Dict[str, Mapping[str, FrozenSet[str]]]:
+        delta = {}
+        for a in range(len(self.symbols) + 1):
+            symbol = '' if a == self.epsilon_id else self.symbols[a]
+            offsets, targets = self.offsets[a], self.targets[a]
+            for q in range(len(self.states)):
+                begin, end = offsets[q], offsets[q + 1]
+                if begin != end:
+                    delta.setdefault(self.states[q], {})[symbol] = frozenset(
+                        self.states[t] for t in targets[begin:end]
+                    )
+        return {state: MappingProxyType(trans) for state, trans in delta.items()}
+
+    def edges(self, state: int) -> Iterator[Tuple[int, int]]:
+        # Inclui as transições ε, com símbolo epsilon_id
+        for a in range(len(self.symbols) + 1):
+            offsets = self.offsets[a]
+            for target in self.targets[a][offsets[state]:offsets[state + 1]]:
+                yield a, target
+
+    def successors(self, state: int, symbol: int) -> array:
+        """Destinos (índices) do estado ``state`` pelo símbolo ``symbol``."""
+        offsets = self.offsets[symbol]
+        return self.targets[symbol][offsets[state]:offsets[state + 1]]
+
+    def simulate_quiet(self, input_string: str) -> bool:
+        """
+        Simula a cadeia diretamente no AFN, acompanhando o conjunto de estados
+        ativos (com ε-closure), sem determinizar e sem prints.
+        
+        Args:
+            input_string: A cadeia a ser testada
+            
+        Returns:
+            bool: True se a cadeia é aceita, False caso contrário
+        """
+        eps_offsets = self.offsets[self.epsilon_id]
+        eps_targets = self.targets[self.epsilon_id]
+        
+        def closure(states):
+            stack = list(states)
+            while stack:
+                state = stack.pop()
+                for i in range(eps_offsets[state], eps_offsets[state + 1]):
+                    if eps_targets[i] not in states:
+                        states.add(eps_targets[i])
+                        stack.append(eps_targets[i])
+            return states
+        
+        current = closure({self.start})
+        for symbol in input_string:
+            a = self.symbol_index.get(symbol)
+            if a is None:
+                return False
+            offsets, targets = self.offsets[a], self.targets[a]
+            next_states = set()
+            for state in current:
+                next_states.update(targets[offsets[state]:offsets[state + 1]])
+            if not next_states:
+                return False
+            current = closure(next_states)
+        
+        return any(self.finals[state] for state in current)
     
+    def has_epsilon(self) -> bool:
+        """Indica se o AFN possui alguma transição ε."""
+        return len(self.targets[self.epsilon_id]) > 0
+
     def print_transition_table(self):
-        AutomataFormatter.print_afn_transition_table(self)
\ No newline at end of file
+        AutomataFormatter.print_afn_transition_table(self)
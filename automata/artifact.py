@@ -0,0 +1,134 @@
+import mmap
+import struct
+import sys
+from array import array
+from typing import Tuple
+from .afd import AFD
+
+
+# Cabeçalho: assinatura, nº de estados, nº de símbolos, bytes dos símbolos, estado inicial
+HEADER = struct.Struct('<4sIIIi')
+MAGIC = b'AFD1'
+ITEMSIZE = 4  # Entradas da tabela em int32
+
+# Extensão sugerida para os arquivos de autômato pré-compilado
+EXTENSION = '.afd'
+
+
+class StateLabels:
+    """
+    Sequência leve de rótulos ``{q<i>}`` para AFDs carregados de tabelas
+    compiladas, que não guardam os rótulos originais dos estados.
+    """
+
+    __slots__ = ('size',)
+
+    def __init__(self, size: int):
+        self.size = size
+
+    def __len__(self):
+        return self.size
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(self.size))]
+        if index < 0:
+            index += self.size
+        if not 0 <= index < self.size:
+            raise IndexError(index)
+        return frozenset({f"q{index}"})
+
+
+def layout(afd: AFD) -> Tuple[bytes, int, int, int]:
+    """
+    Calcula o layout binário do AFD: cabeçalho, símbolos (UTF-8 separados por
+    ``\\0``, com preenchimento até múltiplo de 4), tabela ``int32``
+    little-endian de ``n * k`` posições e ``n`` bytes de estados finais.
+
+    Returns:
+        Tuple: (símbolos codificados, início da tabela, início dos finais, tamanho total)
+    """
+    symbols = '\0'.join(afd.symbols).encode('utf-8')
+    n, k = len(afd.states), len(afd.symbols)
+    table_offset = _align(HEADER.size + len(symbols))
+    finals_offset = table_offset + n * k * ITEMSIZE
+    return symbols, table_offset, finals_offset, finals_offset + n
+
+
+def write_afd(buf, afd: AFD):
+    """Escreve as tabelas do AFD em um buffer gravável com o tamanho de ``layout``."""
+    symbols, table_offset, finals_offset, size = layout(afd)
+    n = len(afd.states)
+    HEADER.pack_into(buf, 0, MAGIC, n, len(afd.symbols), len(symbols), afd.start)
+    buf[HEADER.size:HEADER.size + len(symbols)] = symbols
+    buf[HEADER.size + len(symbols):table_offset] = bytes(table_offset - HEADER.size - len(symbols))
+    table = array('i', afd.table)
+    if sys.byteorder != 'little':
+        table.byteswap()
+    buf[table_offset:finals_offset] = table.tobytes()
+    buf[finals_offset:size] = bytes(afd.finals)
+
+
+def read_afd(buf) -> AFD:
+    """
+    Cria um AFD cujas ``table`` e ``finals`` são visões (sem cópia) sobre o
+    buffer. Apenas o cabeçalho e os símbolos são decodificados; a tabela é
+    percorrida uma vez para conferir que os destinos são estados válidos.
+    Em máquinas big-endian a tabela é copiada e convertida.
+
+    Raises:
+        ValueError: se o conteúdo não é um AFD compilado ou está truncado
+    """
+    view = memoryview(buf)
+    if len(view) < HEADER.size:
+        raise ValueError("Arquivo de AFD compilado truncado: cabeçalho incompleto.")
+    magic, n, k, symbols_size, start = HEADER.unpack_from(view, 0)
+    if magic != MAGIC:
+        raise ValueError("O conteúdo não é um AFD compilado.")
+
+    table_offset = _align(HEADER.size + symbols_size)
+    finals_offset = table_offset + n * k * ITEMSIZE
+    if len(view) < finals_offset + n:
+        raise ValueError(
+            f"Arquivo de AFD compilado truncado: esperados {finals_offset + n} bytes, encontrados {len(view)}."
+        )
+    if not 0 <= start < n:
+        raise ValueError(f"Estado inicial inválido no AFD compilado: {start}.")
+
+    try:
+        raw = bytes(view[HEADER.size:HEADER.size + symbols_size]).decode('utf-8')
+    except UnicodeDecodeError:
+        raise ValueError("Símbolos corrompidos no AFD compilado.")
+    symbols = tuple(raw.split('\0')) if k else ()
+    if len(symbols) != k:
+        raise ValueError("Símbolos corrompidos no AFD compilado.")
+
+    if sys.byteorder == 'little':
+        table = view[table_offset:finals_offset].cast('i')
+    else:
+        table = array('i', bytes(view[table_offset:finals_offset]))
+        table.byteswap()
+    if n * k and (min(table) < -1 or max(table) >= n):
+        raise ValueError("Tabela corrompida no AFD compilado: destino fora dos estados.")
+    finals = view[finals_offset:finals_offset + n]
+    return AFD.from_table(StateLabels(n), symbols, table, start, finals)
+
+
+def save_afd(afd: AFD, filename: str):
+    """Grava o AFD compilado em um arquivo binário."""
+    _, _, _, size = layout(afd)
+    buf = bytearray(size)
+    write_afd(buf, afd)
+    with open(filename, 'wb') as f:
+        f.write(buf)
+
+
+def load_afd(filename: str) -> AFD:
+    """Carrega um AFD compilado, mapeando o arquivo em memória (sem cópia)."""
+    with open(filename, 'rb') as f:
+        data = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+    return read_afd(data)
+
+
+def _align(offset: int) -> int:
+    return (offset + ITEMSIZE - 1) // ITEMSIZE * ITEMSIZE
@@ -1,7 +1,9 @@
 from automata.afn import AFN
 from automata.afd import AFD
-from typing import Set, Dict, FrozenSet, Tuple
+from automata.multi_afd import MultiPatternAFD
+from typing import Set, Dict, Any, Union, Iterable
 from collections import deque
+from array import array
 
 
 EPSILON = 'ε'
@@ -10,7 +12,7 @@ class Converter:
     def __init__(self, grammar: dict):
         self.grammar = grammar
 
-    def convert_glud_to_afn(self) -> AFN:
+    def convert_glud_to_afn(self, verbose: bool = True) -> AFN:
         V = set()
         for production in self.grammar['productions']:
             left, _ = production
@@ -26,40 +28,47 @@ class Converter:
         }
 
         # Debug: verificar as produções
-        print("Produções encontradas:", self.grammar['productions'])
+        if verbose:
+            print("Produções encontradas:", self.grammar['productions'])
 
         for production in self.grammar['productions']:
             left, right = production
-            print(f"Processando produção: {left} -> {right}")
+            if verbose:
+                print(f"Processando produção: {left} -> {right}")
             
             if right == 'ε':
                 # Produção para epsilon: transição para qf com epsilon
                 afn['delta'].setdefault(left, {}).setdefault('', set()).add(qf)
-                print(f"  Adicionada transição épsilon: {left} --ε--> qf")
+                if verbose:
+                    print(f"  Adicionada transição épsilon: {left} --ε--> qf")
                 
             elif len(right) == 2:
                 # Produção do tipo A -> aB
                 a, B = right[0], right[1]
                 afn['delta'].setdefault(left, {}).setdefault(a, set()).add(B)
-                print(f"  Adicionada transição: {left} --{a}--> {B}")
+                if verbose:
+                    print(f"  Adicionada transição: {left} --{a}--> {B}")
                 
             elif len(right) == 1:
                 symbol = right[0]
                 if symbol in self.grammar['Sigma']:
                     # Produção do tipo A -> a (símbolo terminal)
                     afn['delta'].setdefault(left, {}).setdefault(symbol, set()).add(qf)
-                    print(f"  Adicionada transição terminal: {left} --{symbol}--> qf")
+                    if verbose:
+                        print(f"  Adicionada transição terminal: {left} --{symbol}--> qf")
                 elif symbol in V:
                     # Produção unitária do tipo A -> B (não-terminal para não-terminal)
                     # Adicionar transição épsilon de A para B
                     afn['delta'].setdefault(left, {}).setdefault('', set()).add(symbol)
-                    print(f"  Adicionada transição unitária (épsilon): {left} --ε--> {symbol}")
+                    if verbose:
+                        print(f"  Adicionada transição unitária (épsilon): {left} --ε--> {symbol}")
                 else:
                     print(f"  ERRO: Símbolo '{symbol}' não reconhecido na produção {left} -> {right}")
             else:
                 print(f"  ERRO: Produção não reconhecida: {left} -> {right}")
 
-        print("Delta final do AFN:", afn['delta'])
+        if verbose:
+            print("Delta final do AFN:", afn['delta'])
         return AFN(
             Q=afn['Q'],
             Sigma=afn['Sigma'],
@@ -68,120 +77,299 @@ class Converter:
             F=afn['F']
         )
     
+    def convert_regex_to_afn(self, regex: dict) -> AFN:
+        """
+        Converte uma expressão regular analisada por ``RegexParser`` em um AFN
+        sem transições ε usando a construção de Glushkov.
+        
+        O AFN tem um estado por posição da expressão (``p1``..``pn``) mais o
+        estado inicial ``p0``; toda transição que chega em ``pi`` lê o símbolo
+        da posição ``i``. Como não há ε, a determinização dispensa os ε-closures.
+        """
+        positions = regex['positions']
+        follow = [set() for _ in range(len(positions) + 1)]
+        nullable, first, last = self._glushkov(regex['ast'], follow)
+        # O estado inicial segue para as primeiras posições
+        follow[0] = first
+        
+        symbols = tuple(sorted(regex['Sigma']))
+        symbol_index = {symbol: i for i, symbol in enumerate(symbols)}
+        adjacency = [{} for _ in range(len(symbols) + 1)]
+        for q, targets in enumerate(follow):
+            for p in sorted(targets):
+                adjacency[symbol_index[positions[p - 1]]].setdefault(q, []).append(p)
+        
+        finals = set(last)
+        if nullable:
+            finals.add(0)
+        
+        return AFN.from_adjacency(
+            states=tuple(f"p{i}" for i in range(len(positions) + 1)),
+            symbols=symbols,
+            adjacency=adjacency,
+            start=0,
+            finals=finals
+        )
+    
+    def convert_patterns_to_afd(self, patterns: Union[Dict[Any, Union[AFN, dict]], Iterable],
+                                verbose: bool = False) -> MultiPatternAFD:
+        """
+        Constrói um único AFD para vários padrões, marcando em cada estado
+        os padrões que ele aceita (casamento múltiplo em uma só passada).
+        
+        Os AFNs são unidos de forma disjunta (estados renomeados para
+        ``"<i>:<estado>"``) sob um novo estado inicial ``U`` com transições ε
+        para cada estado inicial, e a união é determinizada pela construção
+        de subconjuntos usual.
+        
+        Args:
+            patterns: Dicionário identificador -> AFN ou gramática GLUD (dict
+                retornado por ``GLUDReader.parse``); uma lista usa os índices
+                como identificadores
+            verbose: Se True, exibe a tabela de determinização
+        """
+        if not isinstance(patterns, dict):
+            patterns = dict(enumerate(patterns))
+        
+        afns = []
+        for pattern in patterns.values():
+            if isinstance(pattern, AFN):
+                afns.append(pattern)
+            else:
+                afns.append(Converter(pattern).convert_glud_to_afn(verbose=verbose))
+        
+        symbols = tuple(sorted(set().union(*(afn.symbols for afn in afns))))
+        symbol_index = {symbol: i for i, symbol in enumerate(symbols)}
+        epsilon_id = len(symbols)
+        
+        # Estado 0 é o novo inicial; cada AFN ocupa um bloco contíguo de índices
+        states = ['U']
+        owner = [None]
+        adjacency = [{} for _ in range(len(symbols) + 1)]
+        finals = []
+        for i, (pattern_id, afn) in enumerate(zip(patterns, afns)):
+            base = len(states)
+            states.extend(f"{i}:{state}" for state in afn.states)
+            owner.extend([pattern_id] * len(afn.states))
+            adjacency[epsilon_id].setdefault(0, []).append(base + afn.start)
+            finals.extend(base + q for q, final in enumerate(afn.finals) if final)
+            
+            # Reindexar os arrays CSR do AFN para a tabela de símbolos unificada
+            for a in range(len(afn.symbols) + 1):
+                target_a = epsilon_id if a == afn.epsilon_id else symbol_index[afn.symbols[a]]
+                offsets, targets = afn.offsets[a], afn.targets[a]
+                for q in range(len(afn.states)):
+                    if offsets[q] != offsets[q + 1]:
+                        adjacency[target_a].setdefault(base + q, []).extend(
+                            base + t for t in targets[offsets[q]:offsets[q + 1]]
+                        )
+        
+        union = AFN.from_adjacency(tuple(states), symbols, adjacency, 0, finals)
+        afd = self.convert_afn_to_afd(union, verbose=verbose)
+        
+        # Padrões aceitos em cada estado do AFD
+        state_owner = dict(zip(states, owner))
+        final_labels = union.F
+        tags = tuple(
+            frozenset(state_owner[label] for label in state if label in final_labels)
+            for state in afd.states
+        )
+        
+        multi = MultiPatternAFD.from_table(afd.states, afd.symbols, afd.table, afd.start, afd.finals)
+        multi.tags = tags
+        return multi
+    
+    def _glushkov(self, node, follow):
+        """
+        Calcula (anulável, primeiros, últimos) de um nó da árvore sintática,
+        acumulando em ``follow`` as posições que podem seguir cada posição.
+        """
+        kind = node[0]
+        if kind == 'sym':
+            return False, {node[1]}, {node[1]}
+        if kind == 'eps':
+            return True, set(), set()
+        if kind == 'alt':
+            nullable, first, last = False, set(), set()
+            for child in node[1]:
+                child_nullable, child_first, child_last = self._glushkov(child, follow)
+                nullable = nullable or child_nullable
+                first |= child_first
+                last |= child_last
+            return nullable, first, last
+        if kind == 'cat':
+            children = [self._glushkov(child, follow) for child in node[1]]
+            # Primeiros de cada sufixo, da direita para a esquerda
+            suffix_first = set()
+            for child_nullable, child_first, child_last in reversed(children):
+                for p in child_last:
+                    follow[p] |= suffix_first
+                suffix_first = child_first | suffix_first if child_nullable else set(child_first)
+            nullable, last = True, set()
+            for child_nullable, _, child_last in children:
+                last = last | child_last if child_nullable else set(child_last)
+                nullable = nullable and child_nullable
+            return nullable, suffix_first, last
+        
+        # Operadores unários: star, plus, opt
+        child_nullable, first, last = self._glushkov(node[1], follow)
+        if kind in ('star', 'plus'):
+            for p in last:
+                follow[p] |= first
+        return child_nullable or kind != 'plus', first, last
+    
     def epsilon_closure(self, states: Set[str], afn: AFN) -> Set[str]:
         """
         Calcula o ε-closure de um conjunto de estados do AFN.
         Similar à implementação do seu colega, mas adaptado à nossa estrutura.
         """
+        ids = self._epsilon_closure_ids({afn.state_index[s] for s in states}, afn)
+        return {afn.states[q] for q in ids}
+    
+    def transition(self, afn: AFN, states: Set[str], symbol: str) -> Set[str]:
+        """
+        Calcula os estados alcançáveis a partir de um conjunto de estados,
+        lendo um símbolo específico (sem aplicar ε-closure).
+        """
+        a = afn.epsilon_id if symbol == '' else afn.symbol_index.get(symbol)
+        if a is None:
+            return set()
+        ids = self._transition_ids(afn, {afn.state_index[s] for s in states}, a)
+        return {afn.states[q] for q in ids}
+    
+    @staticmethod
+    def _epsilon_closure_ids(states: Set[int], afn: AFN) -> Set[int]:
+        """ε-closure sobre os índices internados do AFN."""
         closure = set(states)
         stack = list(states)
+        offsets = afn.offsets[afn.epsilon_id]
+        targets = afn.targets[afn.epsilon_id]
         
         while stack:
             state = stack.pop()
-            if state in afn.delta and '' in afn.delta[state]:
-                for next_state in afn.delta[state]['']:
-                    if next_state not in closure:
-                        closure.add(next_state)
-                        stack.append(next_state)
+            for i in range(offsets[state], offsets[state + 1]):
+                next_state = targets[i]
+                if next_state not in closure:
+                    closure.add(next_state)
+                    stack.append(next_state)
         return closure
     
-    def transition(self, afn: AFN, states: Set[str], symbol: str) -> Set[str]:
-        """
-        Calcula os estados alcançáveis a partir de um conjunto de estados,
-        lendo um símbolo específico (sem aplicar ε-closure).
-        """
+    @staticmethod
+    def _transition_ids(afn: AFN, states: Set[int], symbol: int) -> Set[int]:
+        """Transição sobre os índices internados do AFN (sem ε-closure)."""
         next_states = set()
+        offsets = afn.offsets[symbol]
+        targets = afn.targets[symbol]
         for state in states:
-            if state in afn.delta and symbol in afn.delta[state]:
-                next_states.update(afn.delta[state][symbol])
+            next_states.update(targets[offsets[state]:offsets[state + 1]])
         return next_states
     
-    def convert_afn_to_afd(self, afn: AFN) -> AFD:
+    def convert_afn_to_afd(self, afn: AFN, verbose: bool = True) -> AFD:
         """
         Converte um AFN em um AFD usando o algoritmo de determinização,
         garantindo que o AFD seja completo com estado sumidouro.
+        
+        A construção de subconjuntos trabalha sobre os índices internados do
+        AFN e preenche diretamente a tabela compilada do AFD. Se o AFN não
+        tiver transições ε (ex.: construção de Glushkov), os ε-closures são
+        dispensados.
+        
+        Args:
+            afn: O AFN a ser determinizado
+            verbose: Se True, exibe a tabela de determinização
         """
+        symbols = tuple(sorted(afn.Sigma))
+        symbol_ids = [afn.symbol_index[symbol] for symbol in symbols]
+        
+        if afn.has_epsilon():
+            closure = lambda states: frozenset(self._epsilon_closure_ids(states, afn))
+        else:
+            closure = frozenset
+        
         # Calcular o estado inicial do AFD
-        initial_closure = self.epsilon_closure({afn.q0}, afn)
-        initial_afd = frozenset(initial_closure)
+        initial_afd = closure({afn.start})
         
-        states_afd = {initial_afd}
+        # Estados do AFD (conjuntos de índices do AFN) -> índice no AFD
+        state_ids = {initial_afd: 0}
+        subsets = [initial_afd]
+        table = array('i')
         queue = deque([initial_afd])
-        delta_afd = {}
         
         # Estado sumidouro (sink state) - conjunto vazio
         SINK_STATE = frozenset()
-        sink_needed = False
+        
+        def label(subset):
+            return frozenset(afn.states[q] for q in subset)
+        
+        def subset_str(subset):
+            return "{" + ",".join(sorted(label(subset))) + "}"
         
         # Tabela para visualização
-        print("\n# Tabela de Determinização:")
-        header = f"| Estado | {' | '.join(sorted(afn.Sigma))} |"
-        print(header)
-        print("|" + "-" * (len(header) - 2) + "|")
+        if verbose:
+            print("\n# Tabela de Determinização:")
+            header = f"| Estado | {' | '.join(symbols)} |"
+            print(header)
+            print("|" + "-" * (len(header) - 2) + "|")
         
-        # Processar todos os estados do AFD
+        # Processar todos os estados do AFD (em ordem de descoberta)
         while queue:
             current_state = queue.popleft()
             
             # Linha da tabela
-            if current_state == SINK_STATE:
-                current_str = "∅"
-            else:
-                current_str = "{" + ",".join(sorted(current_state)) + "}"
-            row = f"| {current_str} "
+            if verbose:
+                if current_state == SINK_STATE:
+                    current_str = "∅"
+                else:
+                    current_str = subset_str(current_state)
+                row = f"| {current_str} "
             
-            for symbol in sorted(afn.Sigma):
+            for a in symbol_ids:
                 # Calcular transição - primeiro sem ε-closure
-                direct_states = self.transition(afn, current_state, symbol)
+                direct_states = self._transition_ids(afn, current_state, a)
                 
                 if not direct_states:
                     # Transição indefinida - vai para estado sumidouro
                     next_state = SINK_STATE
-                    sink_needed = True
-                    row += "| ∅ "
+                    if verbose:
+                        row += "| ∅ "
                 else:
                     # Aplicar ε-closure
-                    next_closure = self.epsilon_closure(direct_states, afn)
-                    next_state = frozenset(next_closure)
-                    
-                    # Para a tabela
-                    next_str = "{" + ",".join(sorted(next_state)) + "}"
-                    row += f"| {next_str} "
-                
-                # Adicionar transição
-                delta_afd[(current_state, symbol)] = next_state
+                    next_state = closure(direct_states)
+                    if verbose:
+                        row += f"| {subset_str(next_state)} "
                 
                 # Se for novo estado, adicionar à fila
-                if next_state not in states_afd:
-                    states_afd.add(next_state)
+                next_id = state_ids.get(next_state)
+                if next_id is None:
+                    next_id = state_ids[next_state] = len(subsets)
+                    subsets.append(next_state)
                     queue.append(next_state)
+                
+                # Adicionar transição
+                table.append(next_id)
             
-            print(row + "|")
-        
-        # Se o estado sumidouro foi usado, adicionar suas transições
-        if sink_needed:
-            print("| ∅ ", end="")
-            for symbol in sorted(afn.Sigma):
-                delta_afd[(SINK_STATE, symbol)] = SINK_STATE
-                print("| ∅ ", end="")
-            print("|")
-            
-            # Garantir que o estado sumidouro está nos estados
-            states_afd.add(SINK_STATE)
+            if verbose:
+                print(row + "|")
+        
+        # Se o estado sumidouro foi usado, exibir suas transições
+        if verbose and SINK_STATE in state_ids:
+            print("| ∅ " + "| ∅ " * len(symbols) + "|")
         
         # Determinar estados finais (estado sumidouro nunca é final)
-        finals_afd = {state for state in states_afd 
-                    if state != SINK_STATE and any(q in afn.F for q in state)}
-        
-        print(f"\n# Estados finais identificados: {len(finals_afd)}")
-        for final in finals_afd:
-            final_str = "{" + ",".join(sorted(final)) + "}"
-            print(f"  {final_str}")
-        
-        return AFD(
-            Q=states_afd,
-            Sigma=afn.Sigma,
-            delta=delta_afd,
-            q0=initial_afd,
-            F=finals_afd
-        )
\ No newline at end of file
+        finals_afd = bytearray(
+            1 if any(afn.finals[q] for q in subset) else 0 for subset in subsets
+        )
+        
+        if verbose:
+            print(f"\n# Estados finais identificados: {sum(finals_afd)}")
+            for subset, final in zip(subsets, finals_afd):
+                if final:
+                    print(f"  {subset_str(subset)}")
+        
+        return AFD.from_table(
+            states=tuple(label(subset) for subset in subsets),
+            symbols=symbols,
+            table=table,
+            start=0,
+            finals=finals_afd
+        )
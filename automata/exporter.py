@@ -0,0 +1,242 @@
+import json
+from array import array
+from collections import deque
+from typing import Dict, Iterator, List, Optional, TextIO, Tuple
+
+EPSILON = 'ε'
+
+# Limite padrão de estados do DOT antes de entrar no modo resumido
+DEFAULT_DOT_MAX_STATES = 1000
+
+
+class AutomataExporter:
+    """
+    Exportadores em fluxo (DOT e JSON/JSON-Lines) para autômatos grandes.
+
+    Os estados são identificados pelos índices internados (``q<i>``); o rótulo
+    original de cada estado é escrito uma única vez, na declaração do estado,
+    e as transições referenciam apenas os identificadores. As transições são
+    geradas estado a estado a partir das tabelas compiladas, sem montar
+    ``delta`` nem o texto inteiro em memória.
+
+    Opções comuns:
+        collapse_sink: omite os estados mortos (como o sumidouro ∅ do AFD) e
+            as transições que chegam neles
+        collapse_parallel: agrupa numa só aresta os símbolos que ligam o
+            mesmo par de estados (ex.: ``a-z,0``)
+        max_states: se o autômato tiver mais estados que isso, entra no modo
+            resumido: mantém os ``max_states`` primeiros estados em largura a
+            partir do inicial e agrupa os demais por distância ao inicial
+            (um nó por nível), com as transições entre grupos contadas
+    """
+
+    @staticmethod
+    def write_dot(af, f: TextIO, collapse_sink: bool = True, collapse_parallel: bool = True,
+                  max_states: Optional[int] = DEFAULT_DOT_MAX_STATES):
+        """Escreve o autômato no formato DOT (Graphviz) no arquivo ``f``."""
+        f.write("digraph AF {\n")
+        f.write("  rankdir=LR;\n")
+        f.write("  node [shape=circle];\n")
+        f.write('  __start [shape=point, label=""];\n')
+        for kind, record in AutomataExporter._records(af, collapse_sink, collapse_parallel, max_states):
+            if kind == 'state':
+                shape = ', shape=doublecircle' if record['final'] else ''
+                f.write(f'  {record["id"]} [label="{_escape(record["label"])}"{shape}];\n')
+                if record['initial']:
+                    f.write(f'  __start -> {record["id"]};\n')
+            elif kind == 'cluster':
+                shape = 'doubleoctagon' if record['finals'] else 'box3d'
+                label = f'nível {record["depth"]}: {record["states"]} estados'
+                if record['finals']:
+                    label += f' ({record["finals"]} finais)'
+                f.write(f'  {record["id"]} [label="{label}", shape={shape}];\n')
+            elif 'count' in record:
+                f.write(f'  {record["source"]} -> {record["target"]} '
+                        f'[label="{record["count"]} transições", style=dashed];\n')
+            else:
+                label = _symbols_label(record['symbols'])
+                f.write(f'  {record["source"]} -> {record["target"]} [label="{_escape(label)}"];\n')
+        f.write("}\n")
+
+    @staticmethod
+    def write_jsonl(af, f: TextIO, collapse_sink: bool = True, collapse_parallel: bool = True,
+                    max_states: Optional[int] = None):
+        """
+        Escreve o autômato em JSON-Lines: um registro ``automaton`` seguido de
+        um registro por estado (``state``/``cluster``) e por aresta (``edge``).
+        """
+        f.write(json.dumps(AutomataExporter._header(af), ensure_ascii=False) + "\n")
+        for kind, record in AutomataExporter._records(af, collapse_sink, collapse_parallel, max_states):
+            f.write(json.dumps({'type': kind, **record}, ensure_ascii=False) + "\n")
+
+    @staticmethod
+    def write_json(af, f: TextIO, collapse_sink: bool = True, collapse_parallel: bool = True,
+                   max_states: Optional[int] = None):
+        """
+        Escreve o autômato como um único documento JSON
+        (``{"automaton": ..., "states": [...], "edges": [...]}``), gerado em fluxo.
+        """
+        f.write('{"automaton": ' + json.dumps(AutomataExporter._header(af), ensure_ascii=False))
+        f.write(',\n"states": [')
+        section = 'states'
+        first = True
+        for kind, record in AutomataExporter._records(af, collapse_sink, collapse_parallel, max_states):
+            if kind == 'edge' and section == 'states':
+                f.write('],\n"edges": [')
+                section = 'edges'
+                first = True
+            if kind == 'cluster':
+                record = {'cluster': True, **record}
+            f.write(('\n' if first else ',\n') + json.dumps(record, ensure_ascii=False))
+            first = False
+        if section == 'states':
+            f.write('],\n"edges": [')
+        f.write(']}\n')
+
+    @staticmethod
+    def _header(af) -> dict:
+        return {
+            'type': 'automaton',
+            'kind': type(af).__name__,
+            'states': len(af.states),
+            'symbols': list(af.symbols),
+            'start': f"q{af.start}",
+        }
+
+    @staticmethod
+    def _records(af, collapse_sink: bool, collapse_parallel: bool,
+                 max_states: Optional[int]) -> Iterator[Tuple[str, dict]]:
+        """
+        Gera os registros ``('state'|'cluster'|'edge', dados)``: primeiro todos
+        os estados e grupos, depois todas as arestas.
+        """
+        n = len(af.states)
+        live = [distance >= 0 for distance in af.distance_to_final()] if collapse_sink else None
+
+        def visible(q):
+            return live is None or live[q] or q == af.start
+
+        # Modo resumido: estados além dos max_states primeiros viram grupos por nível
+        group = None
+        if max_states is not None and n > max_states:
+            group, clusters = _clusters(af, max_states, visible)
+        else:
+            clusters = []
+
+        for q in range(n):
+            if visible(q) and (group is None or group[q] < 0):
+                yield 'state', {
+                    'id': f"q{q}",
+                    'label': _state_label(af.states[q]),
+                    'initial': q == af.start,
+                    'final': bool(af.finals[q]),
+                }
+        for cluster in clusters:
+            yield 'cluster', cluster
+
+        aggregated: Dict[Tuple[str, str], int] = {}
+        for q in range(n):
+            if not visible(q):
+                continue
+            targets = {}
+            for a, t in af.edges(q):
+                if not visible(t):
+                    continue
+                if group is not None and (group[q] >= 0 or group[t] >= 0):
+                    source = f"q{q}" if group[q] < 0 else f"g{group[q]}"
+                    target = f"q{t}" if group[t] < 0 else f"g{group[t]}"
+                    aggregated[(source, target)] = aggregated.get((source, target), 0) + 1
+                    continue
+                if collapse_parallel:
+                    targets.setdefault(t, []).append(a)
+                else:
+                    yield 'edge', {'source': f"q{q}", 'target': f"q{t}", 'symbols': [_symbol(af, a)]}
+            for t, symbols in targets.items():
+                yield 'edge', {
+                    'source': f"q{q}",
+                    'target': f"q{t}",
+                    'symbols': [_symbol(af, a) for a in symbols],
+                }
+        for (source, target), count in aggregated.items():
+            yield 'edge', {'source': source, 'target': target, 'count': count}
+
+
+def _clusters(af, max_states: int, visible) -> Tuple[array, List[dict]]:
+    """
+    Mantém os ``max_states`` primeiros estados visíveis em largura a partir do
+    inicial e agrupa os demais por distância ao inicial. Retorna o grupo de
+    cada estado (-1 se mantido) e a descrição de cada grupo.
+    """
+    n = len(af.states)
+    depth = array('i', [-1]) * n
+    order = []
+    depth[af.start] = 0
+    queue = deque([af.start])
+    while queue:
+        state = queue.popleft()
+        order.append(state)
+        for _, target in af.edges(state):
+            if depth[target] < 0 and visible(target):
+                depth[target] = depth[state] + 1
+                queue.append(target)
+
+    group = array('i', [-1]) * n
+    levels: Dict[int, int] = {}
+    clusters = []
+    for position, state in enumerate(order):
+        if position < max_states:
+            continue
+        d = depth[state]
+        if d not in levels:
+            levels[d] = len(clusters)
+            clusters.append({'id': f"g{len(clusters)}", 'depth': d, 'states': 0, 'finals': 0})
+        cluster = clusters[levels[d]]
+        group[state] = levels[d]
+        cluster['states'] += 1
+        cluster['finals'] += af.finals[state]
+
+    # Estados visíveis inalcançáveis a partir do inicial formam um último grupo
+    unreachable = [q for q in range(n) if depth[q] < 0 and visible(q)]
+    if unreachable:
+        index = len(clusters)
+        clusters.append({'id': f"g{index}", 'depth': -1, 'states': len(unreachable),
+                         'finals': sum(af.finals[q] for q in unreachable)})
+        for q in unreachable:
+            group[q] = index
+    return group, clusters
+
+
+def _state_label(state) -> str:
+    if isinstance(state, (set, frozenset)):
+        if not state:
+            return "∅"
+        return "{" + ",".join(sorted(str(s) for s in state)) + "}"
+    return str(state)
+
+
+def _symbol(af, a: int) -> str:
+    return EPSILON if a == len(af.symbols) else af.symbols[a]
+
+
+def _symbols_label(symbols: List[str]) -> str:
+    """Compacta sequências de caracteres consecutivos em intervalos (ex.: ``a-z``)."""
+    parts = []
+    run = []
+    for symbol in sorted(symbols):
+        if run and len(symbol) == 1 and len(run[-1]) == 1 and ord(symbol) == ord(run[-1]) + 1:
+            run.append(symbol)
+            continue
+        if run:
+            parts.append(_run_label(run))
+        run = [symbol]
+    if run:
+        parts.append(_run_label(run))
+    return ",".join(parts)
+
+
+def _run_label(run: List[str]) -> str:
+    return f"{run[0]}-{run[-1]}" if len(run) > 2 else ",".join(run)
+
+
+def _escape(text: str) -> str:
+    return text.replace('\\', '\\\\').replace('"', '\\"')
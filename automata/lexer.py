@@ -0,0 +1,106 @@
+from array import array
+from typing import Iterable, Iterator, Tuple, Union, Optional
+from .afn import AFN
+from .converter import Converter
+
+
+class Lexer:
+    """
+    Analisador léxico gerado a partir de várias gramáticas GLUD (ou AFNs).
+
+    As regras são pares ``(tipo_do_token, gramática_ou_AFN)`` em ordem de
+    prioridade: quando mais de uma regra reconhece o mesmo lexema, vence a que
+    aparece primeiro. Todas as regras são combinadas em um único AFD
+    (``Converter.convert_patterns_to_afd``) e a entrada é percorrida uma só vez
+    com a regra do casamento mais longo, guardando a última posição de
+    aceitação. Estados a partir dos quais nenhum estado final é alcançável
+    encerram a leitura do lexema imediatamente.
+
+    Os pares (estado, posição) lidos depois da última aceitação de um lexema
+    são memorizados como falhas: uma leitura posterior que chega a um deles
+    para na hora, pois já se sabe que dali não há aceitação. Cada par falha
+    no máximo uma vez, então a análise é linear no tamanho da entrada mesmo
+    quando o casamento mais longo obriga a reler trechos.
+    """
+
+    __slots__ = ('afd', 'token_types', 'accept', 'live', 'skip')
+
+    def __init__(self, rules: Iterable[Tuple[str, Union[AFN, dict]]], skip: Iterable[str] = ()):
+        rules = list(rules)
+        self.token_types = tuple(token_type for token_type, _ in rules)
+        if len(set(self.token_types)) != len(self.token_types):
+            raise ValueError("Tipos de token repetidos nas regras do analisador léxico.")
+        priority = {token_type: i for i, token_type in enumerate(self.token_types)}
+
+        self.afd = Converter({}).convert_patterns_to_afd(dict(rules))
+        self.skip = frozenset(skip)
+
+        # Token aceito em cada estado: índice da regra de maior prioridade, ou -1
+        self.accept = array('i', (
+            min((priority[tag] for tag in tags), default=-1) for tags in self.afd.tags
+        ))
+        # Estados a partir dos quais algum estado final é alcançável
+        self.live = bytearray(distance >= 0 for distance in self.afd.distance_to_final())
+
+    def tokenize(self, text: str, start: int = 0) -> Iterator[Tuple[str, int, int]]:
+        """
+        Gera as tuplas ``(tipo_do_token, início, fim)`` da entrada, com ``fim``
+        exclusivo. Tokens cujo tipo está em ``skip`` são consumidos mas não
+        gerados.
+
+        Raises:
+            ValueError: se nenhum token reconhece a entrada em alguma posição
+        """
+        table = self.afd.table
+        symbol_index = self.afd.symbol_index
+        k = len(self.afd.symbols)
+        n = len(self.afd.states)
+        accept = self.accept
+        live = self.live
+        initial = self.afd.start
+        length = len(text)
+        position = start
+        # Pares (estado, posição) sem aceitação à frente, codificados como posição * n + estado
+        failed = set()
+
+        while position < length:
+            state = initial
+            last_token = -1
+            last_end = position
+            index = position
+            visited = []
+            while index < length:
+                a = symbol_index.get(text[index])
+                if a is None:
+                    break
+                state = table[state * k + a]
+                if state < 0 or not live[state]:
+                    break
+                index += 1
+                pair = index * n + state
+                if pair in failed:
+                    break
+                if accept[state] >= 0:
+                    last_token = accept[state]
+                    last_end = index
+                    visited.clear()
+                else:
+                    visited.append(pair)
+            failed.update(visited)
+
+            if last_token < 0:
+                raise ValueError(
+                    f"Nenhum token reconhece a entrada na posição {position}: '{text[position:position + 20]}'"
+                )
+
+            token_type = self.token_types[last_token]
+            if token_type not in self.skip:
+                yield token_type, position, last_end
+            position = last_end
+
+    def token_type(self, lexeme: str) -> Optional[str]:
+        """Tipo do token que reconhece exatamente ``lexeme`` (ou None)."""
+        tags = self.afd.match(lexeme)
+        if not tags:
+            return None
+        return min(tags, key=self.token_types.index)
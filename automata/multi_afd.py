@@ -0,0 +1,44 @@
+from typing import Any, Set, FrozenSet
+from .afd import AFD
+
+
+class MultiPatternAFD(AFD):
+    """
+    AFD combinado de vários padrões (união de AFNs/gramáticas).
+
+    Cada estado carrega em ``tags[q]`` o conjunto de identificadores dos padrões
+    que aceitam ao terminar nele, de modo que uma única passada sobre a cadeia
+    informa todos os padrões reconhecidos. Um estado é final se aceita algum
+    padrão; ``simulate`` continua respondendo "algum padrão aceita?".
+    """
+
+    __slots__ = ('tags',)
+
+    def match(self, input_string: str) -> Set[Any]:
+        """
+        Retorna os identificadores de todos os padrões que aceitam a cadeia.
+
+        Args:
+            input_string: A cadeia a ser testada
+
+        Returns:
+            Set: Identificadores dos padrões que aceitam (vazio se nenhum)
+        """
+        table = self.table
+        symbol_index = self.symbol_index
+        k = len(self.symbols)
+        current = self.start
+
+        for symbol in input_string:
+            a = symbol_index.get(symbol)
+            if a is None:
+                return set()
+            current = table[current * k + a]
+            if current < 0:
+                return set()
+
+        return set(self.tags[current])
+
+    def accepting_patterns(self, state: FrozenSet[str]) -> FrozenSet[Any]:
+        """Padrões aceitos no estado ``state`` (rótulo do AFD)."""
+        return self.tags[self.state_index[state]]
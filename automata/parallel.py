@@ -0,0 +1,139 @@
+import os
+from array import array
+from itertools import islice
+from multiprocessing import Pool
+from typing import Dict, Iterable, List, Optional, Sequence
+
+
+# Tamanho padrão dos blocos da cadeia distribuídos entre os processos
+DEFAULT_CHUNK_SIZE = 1 << 20
+
+
+def premultiplied_table(afd) -> array:
+    """
+    Compila a tabela do AFD para a simulação por blocos: um estado morto extra
+    de índice ``len(afd.states)`` absorve as transições indefinidas, a coluna
+    de índice ``len(afd.symbols)`` (símbolos fora do alfabeto) leva todos os
+    estados ao estado morto, e as entradas são pré-multiplicadas pelo número
+    de colunas (o destino de ``state`` pela coluna ``c`` é ``table[state + c]``).
+    """
+    n = len(afd.states)
+    k = len(afd.symbols)
+    columns = k + 1
+    dead = n * columns
+    table = array('q')
+    for q in range(n):
+        table.extend(dead if target < 0 else target * columns for target in afd.table[q * k:(q + 1) * k])
+        table.append(dead)
+    table.extend([dead] * columns)
+    return table
+
+
+def compose_chunk(table: Sequence[int], origins: List[int], classes: Sequence[int]) -> List[int]:
+    """
+    Núcleo da simulação por blocos (compartilhado com ``Scanner``): calcula o
+    estado alcançado a partir de cada estado de ``origins`` após ler as
+    colunas ``classes``, sobre uma tabela com entradas pré-multiplicadas.
+
+    A função de transição do bloco é composta coluna a coluna sobre o vetor
+    de estados ativos distintos; estados que colidem são fundidos a cada
+    passo, e assim que resta um único estado ativo o restante do bloco segue
+    o caminho determinístico pela tabela.
+    """
+    # live[i] é um estado ativo distinto; owner[j] aponta o índice em live da origem j
+    live = list(origins)
+    owner = list(range(len(origins)))
+    index = 0
+    length = len(classes)
+    while len(live) > 1 and index < length:
+        column = classes[index]
+        live = [table[state + column] for state in live]
+        index += 1
+        if len(set(live)) < len(live):
+            position = {}
+            remap = []
+            merged = []
+            for state in live:
+                if state not in position:
+                    position[state] = len(merged)
+                    merged.append(state)
+                remap.append(position[state])
+            owner = [remap[i] for i in owner]
+            live = merged
+
+    if len(live) == 1 and index < length:
+        # Um único estado ativo: basta seguir o caminho determinístico
+        state = live[0]
+        for column in islice(classes, index, None):
+            state = table[state + column]
+        live = [state]
+
+    return [live[i] for i in owner]
+
+
+def chunk_mapping(afd, text: str, table: Optional[array] = None) -> List[int]:
+    """
+    Calcula, para cada estado de origem (incluindo o estado morto, de índice
+    ``len(afd.states)``), o estado alcançado após ler ``text``.
+    """
+    if table is None:
+        table = premultiplied_table(afd)
+    return _chunk_mapping(table, afd.symbol_index, len(afd.states), text)
+
+
+def _chunk_mapping(table: array, symbol_index: Dict[str, int], n: int, text: str) -> List[int]:
+    k = len(symbol_index)
+    columns = k + 1
+    classes = [symbol_index.get(symbol, k) for symbol in text]
+    # O estado morto fica fora do vetor de origens: ele sempre leva a si mesmo
+    mapping = [state // columns for state in compose_chunk(table, [q * columns for q in range(n)], classes)]
+    mapping.append(n)
+    return mapping
+
+
+def prefix_scan(mappings: Iterable[List[int]], start: int) -> List[int]:
+    """
+    Combina os mapeamentos dos blocos em ordem. Retorna o estado de entrada
+    de cada bloco seguido do estado final (``len(mappings) + 1`` posições).
+    """
+    states = [start]
+    for mapping in mappings:
+        states.append(mapping[states[-1]])
+    return states
+
+
+def simulate_parallel(afd, input_string: str, processes: Optional[int] = None,
+                      chunk_size: int = DEFAULT_CHUNK_SIZE) -> bool:
+    """
+    Simula uma cadeia longa no AFD dividindo-a em blocos processados em
+    paralelo: cada processo calcula o mapeamento estado -> estado do seu
+    bloco a partir de todos os estados, e os mapeamentos são combinados
+    por uma varredura de prefixos a partir do estado inicial.
+    """
+    if processes is None:
+        processes = os.cpu_count() or 1
+    if processes <= 1 or len(input_string) <= chunk_size:
+        return afd.simulate_quiet(input_string)
+
+    # Os blocos são fatiados sob demanda; os processos recebem só a tabela
+    # compilada (um array), não o AFD, cuja tabela pode ser uma visão sobre
+    # memória compartilhada ou arquivo mapeado
+    chunks = (input_string[i:i + chunk_size] for i in range(0, len(input_string), chunk_size))
+    initargs = (premultiplied_table(afd), afd.symbol_index, len(afd.states))
+    with Pool(processes, initializer=_init_worker, initargs=initargs) as pool:
+        final_state = prefix_scan(pool.imap(_worker_mapping, chunks), afd.start)[-1]
+    return final_state != len(afd.states) and bool(afd.finals[final_state])
+
+
+# Estado de cada processo trabalhador (definido pelo inicializador do Pool)
+_worker_table = None
+
+
+def _init_worker(table: array, symbol_index: Dict[str, int], n: int):
+    global _worker_table
+    _worker_table = (table, symbol_index, n)
+
+
+def _worker_mapping(text: str) -> List[int]:
+    table, symbol_index, n = _worker_table
+    return _chunk_mapping(table, symbol_index, n, text)
@@ -0,0 +1,198 @@
+import mmap
+import os
+from array import array
+from multiprocessing import Pool
+from typing import Iterator, List, Optional, Tuple
+from .afd import AFD
+from .afn import AFN
+from .parallel import compose_chunk
+
+
+# Tamanho padrão dos blocos lidos do arquivo (16 MiB)
+DEFAULT_CHUNK_SIZE = 16 * 1024 * 1024
+
+
+class Scanner:
+    """
+    Busca de ocorrências da linguagem de um AFD dentro de textos/arquivos.
+
+    O AFD é transformado no AFD de busca de Σ*·L, de modo que cada posição em
+    que o estado corrente é final marca o fim de uma ocorrência. A tabela é
+    compilada sobre classes de bytes: cada símbolo do alfabeto (um caractere
+    que ocupa um byte em ``encoding``) vira uma coluna, e uma coluna extra
+    representa os bytes fora do alfabeto, que reiniciam a busca. As entradas
+    da tabela são pré-multiplicadas pelo número de colunas, evitando uma
+    multiplicação por byte lido.
+
+    Os deslocamentos retornados são posições de fim (exclusivas): a ocorrência
+    termina no byte ``offset - 1``. Se ε pertence à linguagem, toda posição
+    (inclusive 0) é um fim de ocorrência.
+    """
+
+    __slots__ = ('table', 'accept', 'start', 'columns', 'byte_classes', 'n_states')
+
+    def __init__(self, afd: AFD, encoding: str = 'latin-1'):
+        from .converter import Converter  # Import local para evitar circulares
+
+        byte_of = {}
+        for symbol in afd.symbols:
+            encoded = symbol.encode(encoding)
+            if len(encoded) != 1:
+                raise ValueError(
+                    f"Símbolo '{symbol}' não ocupa exatamente um byte em {encoding}."
+                )
+            byte_of[symbol] = encoded[0]
+
+        # AFN de Σ*·L: novo inicial com laço em todo símbolo e ε para o inicial do AFD
+        k = len(afd.symbols)
+        n = len(afd.states)
+        adjacency = [{} for _ in range(k + 1)]
+        for a in range(k):
+            adjacency[a][0] = [0]
+            for q in range(n):
+                target = afd.table[q * k + a]
+                if target >= 0:
+                    adjacency[a].setdefault(q + 1, []).append(target + 1)
+        adjacency[k][0] = [afd.start + 1]
+        finals = [q + 1 for q, final in enumerate(afd.finals) if final]
+        search_afn = AFN.from_adjacency(
+            states=('S',) + tuple(f"q{q}" for q in range(n)),
+            symbols=afd.symbols,
+            adjacency=adjacency,
+            start=0,
+            finals=finals
+        )
+        search = Converter({}).convert_afn_to_afd(search_afn, verbose=False)
+
+        # Compilar a tabela pré-multiplicada com a coluna extra "fora do alfabeto"
+        self.columns = columns = k + 1
+        self.n_states = len(search.states)
+        self.start = search.start * columns
+        self.table = array('q')
+        self.accept = bytearray(self.n_states * columns)
+        for q in range(self.n_states):
+            row = search.table[q * k:(q + 1) * k]
+            self.table.extend(target * columns for target in row)
+            self.table.append(self.start)
+            self.accept[q * columns] = search.finals[q]
+
+        classes = bytearray([k]) * 256
+        for a, symbol in enumerate(afd.symbols):
+            classes[byte_of[symbol]] = a
+        self.byte_classes = bytes(classes)
+
+    def scan(self, data) -> Iterator[int]:
+        """
+        Percorre ``data`` (bytes, bytearray, mmap ou memoryview) e gera os
+        deslocamentos de fim de cada ocorrência.
+        """
+        if self.accept[self.start]:
+            yield 0
+        yield from self._scan_range(data, 0, len(data), self.start)
+
+    def scan_file(self, path: str, chunk_size: int = DEFAULT_CHUNK_SIZE,
+                  processes: Optional[int] = None) -> Iterator[int]:
+        """
+        Mapeia o arquivo em memória e gera os deslocamentos de fim de cada
+        ocorrência, processando-o em blocos de ``chunk_size`` bytes.
+
+        Com ``processes`` > 1 os blocos são distribuídos entre processos:
+        (1) cada bloco calcula em paralelo o mapeamento estado inicial ->
+        estado final; (2) os mapeamentos são compostos em sequência para
+        descobrir o estado de entrada de cada bloco; (3) os blocos são
+        varridos em paralelo a partir desse estado, e os resultados são
+        gerados na ordem do arquivo.
+        """
+        size = os.path.getsize(path)
+        if size == 0:
+            if self.accept[self.start]:
+                yield 0
+            return
+
+        bounds = [(begin, min(begin + chunk_size, size)) for begin in range(0, size, chunk_size)]
+
+        if processes is None or processes <= 1 or len(bounds) == 1:
+            with open(path, 'rb') as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as data:
+                if self.accept[self.start]:
+                    yield 0
+                state = self.start
+                for begin, end in bounds:
+                    offsets, state = self._scan_chunk(data, begin, end, state)
+                    yield from offsets
+            return
+
+        with Pool(processes, initializer=_init_worker, initargs=(self, path)) as pool:
+            # Fase 1: mapeamento de cada bloco a partir de todos os estados
+            mappings = pool.map(_worker_mapping, bounds)
+
+            # Fase 2: composição sequencial para obter o estado de entrada de cada bloco
+            entry_states = []
+            state = self.start
+            for mapping in mappings:
+                entry_states.append(state)
+                state = mapping[state // self.columns]
+
+            # Fase 3: varredura paralela, com os resultados na ordem dos blocos
+            if self.accept[self.start]:
+                yield 0
+            tasks = [(begin, end, entry) for (begin, end), entry in zip(bounds, entry_states)]
+            for offsets in pool.imap(_worker_scan, tasks):
+                yield from offsets
+
+    def _scan_range(self, data, begin: int, end: int, state: int) -> Iterator[int]:
+        """Gera os fins de ocorrência em ``data[begin:end]`` a partir de ``state``."""
+        for position in range(begin, end, DEFAULT_CHUNK_SIZE):
+            offsets, state = self._scan_chunk(data, position, min(position + DEFAULT_CHUNK_SIZE, end), state)
+            yield from offsets
+
+    def _scan_chunk(self, data, begin: int, end: int, state: int) -> Tuple[array, int]:
+        """
+        Varre ``data[begin:end]`` a partir do estado (pré-multiplicado)
+        ``state``. Retorna os fins de ocorrência e o estado ao final do bloco.
+        """
+        table = self.table
+        accept = self.accept
+        offsets = array('q')
+        position = begin + 1
+        for column in bytes(data[begin:end]).translate(self.byte_classes):
+            state = table[state + column]
+            if accept[state]:
+                offsets.append(position)
+            position += 1
+        return offsets, state
+
+    def chunk_mapping(self, data, begin: int, end: int) -> List[int]:
+        """
+        Calcula, para cada estado do AFD de busca, o estado (pré-multiplicado)
+        alcançado após ler ``data[begin:end]``.
+
+        Usa o mesmo núcleo da simulação por blocos (``parallel.compose_chunk``):
+        como o AFD de busca tende a convergir rapidamente, o laço costuma cair
+        para um único estado ativo após poucos bytes.
+        """
+        columns = self.columns
+        classes = bytes(data[begin:end]).translate(self.byte_classes)
+        return compose_chunk(self.table, [q * columns for q in range(self.n_states)], classes)
+
+
+# Estado de cada processo trabalhador (definido pelo inicializador do Pool)
+_worker_scanner = None
+_worker_data = None
+
+
+def _init_worker(scanner: Scanner, path: str):
+    global _worker_scanner, _worker_data
+    _worker_scanner = scanner
+    with open(path, 'rb') as f:
+        _worker_data = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+
+def _worker_mapping(bounds: Tuple[int, int]) -> List[int]:
+    begin, end = bounds
+    return _worker_scanner.chunk_mapping(_worker_data, begin, end)
+
+
+def _worker_scan(task: Tuple[int, int, int]) -> array:
+    begin, end, state = task
+    offsets, _ = _worker_scanner._scan_chunk(_worker_data, begin, end, state)
+    return offsets
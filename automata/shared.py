@@ -0,0 +1,103 @@
+import os
+from multiprocessing import Pool, resource_tracker
+from multiprocessing.shared_memory import SharedMemory
+from typing import Iterable, List, Optional
+from .afd import AFD
+from .artifact import layout, read_afd, write_afd
+
+
+class SharedAFD:
+    """
+    Tabelas compiladas de um AFD em ``multiprocessing.shared_memory``.
+
+    O processo principal publica o AFD com ``SharedAFD.create(afd)``; os
+    processos trabalhadores chamam ``SharedAFD.attach(nome)`` e obtêm um AFD
+    cujas ``table`` e ``finals`` são visões (sem cópia) sobre o mesmo bloco de
+    memória. Anexar custa O(1) no número de estados: apenas o cabeçalho e os
+    símbolos são decodificados. Os rótulos originais dos estados não são
+    publicados; o AFD anexado usa rótulos ``{q<i>}``.
+
+    O bloco usa o mesmo layout binário dos arquivos de ``automata.artifact``.
+    """
+
+    __slots__ = ('shm', 'afd', 'owner')
+
+    def __init__(self, shm: SharedMemory, afd: AFD, owner: bool):
+        self.shm = shm
+        self.afd = afd
+        self.owner = owner
+
+    @property
+    def name(self) -> str:
+        return self.shm.name
+
+    @classmethod
+    def create(cls, afd: AFD, name: Optional[str] = None) -> 'SharedAFD':
+        """Copia as tabelas do AFD para um novo bloco de memória compartilhada."""
+        _, _, _, size = layout(afd)
+        shm = SharedMemory(name=name, create=True, size=size)
+        write_afd(shm.buf, afd)
+        return cls(shm, read_afd(shm.buf), owner=True)
+
+    @classmethod
+    def attach(cls, name: str) -> 'SharedAFD':
+        """Anexa (sem cópia) a um bloco publicado por ``create``."""
+        try:
+            shm = SharedMemory(name=name, track=False)
+        except TypeError:
+            # Python < 3.13: o bloco pertence ao processo que o criou, então o
+            # registro feito ao anexar é desfeito no resource_tracker
+            shm = SharedMemory(name=name)
+            resource_tracker.unregister(shm._name, 'shared_memory')
+        return cls(shm, read_afd(shm.buf), owner=False)
+
+    def close(self):
+        """
+        Libera as visões e fecha o bloco neste processo (o AFD deixa de ser
+        utilizável). O criador também remove o bloco do sistema.
+        """
+        if self.afd is not None:
+            if isinstance(self.afd.table, memoryview):
+                # Em máquinas big-endian a tabela é uma cópia convertida
+                self.afd.table.release()
+            self.afd.finals.release()
+            self.afd = None
+        self.shm.close()
+        if self.owner:
+            # Processos anexados compartilham o resource_tracker do criador e
+            # podem ter desfeito o registro do bloco; ele é refeito (o
+            # registro é idempotente) para que unlink o remova sem erro
+            resource_tracker.register(self.shm._name, 'shared_memory')
+            self.shm.unlink()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+def simulate_many(afd: AFD, strings: Iterable[str], processes: Optional[int] = None,
+                  chunksize: int = 1024) -> List[bool]:
+    """
+    Testa várias cadeias no AFD distribuindo-as entre processos que
+    compartilham uma única cópia da tabela de transições.
+    """
+    if processes is None:
+        processes = os.cpu_count() or 1
+    with SharedAFD.create(afd) as shared:
+        with Pool(processes, initializer=_init_worker, initargs=(shared.name,)) as pool:
+            return pool.map(_worker_simulate, strings, chunksize)
+
+
+# AFD anexado em cada processo trabalhador (definido pelo inicializador do Pool)
+_worker_shared = None
+
+
+def _init_worker(name: str):
+    global _worker_shared
+    _worker_shared = SharedAFD.attach(name)
+
+
+def _worker_simulate(input_string: str) -> bool:
+    return _worker_shared.afd.simulate_quiet(input_string)
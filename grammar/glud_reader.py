@@ -4,7 +4,7 @@ class GLUDReader:
     def __init__(self, filename):
         self.filename = filename
 
-    def parse(self):
+    def parse(self, verbose=True):
         result = {}
         with open(self.filename, 'r', encoding='utf-8') as f:
             header = f.readline()
@@ -23,7 +23,8 @@ class GLUDReader:
                 if not line or line.startswith("#"):
                     continue
                 
-                print(f"Lendo linha: '{line}'")
+                if verbose:
+                    print(f"Lendo linha: '{line}'")
                 
                 prod_match = re.match(r'(\w+)\s*->\s*(.+)', line)
                 if not prod_match:
@@ -37,7 +38,8 @@ class GLUDReader:
                 alternatives = [alt.strip() for alt in right_full.split('|')]
                 
                 for right in alternatives:
-                    print(f"Processando alternativa: {left} -> {right}")
+                    if verbose:
+                        print(f"Processando alternativa: {left} -> {right}")
                     
                     # Validar se o lado esquerdo está em V
                     if left not in result['V']:
@@ -46,13 +48,15 @@ class GLUDReader:
                     # Processar o lado direito
                     if right == 'ε':
                         result['productions'].append((left, 'ε'))
-                        print(f"Adicionada produção epsilon: {left} -> ε")
+                        if verbose:
+                            print(f"Adicionada produção epsilon: {left} -> ε")
                     elif len(right) == 2:
                         # Produção do tipo A -> aB
                         symbol, non_terminal = right[0], right[1]
                         if symbol in result['Sigma'] and non_terminal in result['V']:
                             result['productions'].append((left, right))
-                            print(f"Adicionada produção: {left} -> {right}")
+                            if verbose:
+                                print(f"Adicionada produção: {left} -> {right}")
                         else:
                             print(f"Produção inválida: {left} -> {right}")
                             print(f"  Símbolo '{symbol}' em Sigma: {symbol in result['Sigma']}")
@@ -63,11 +67,13 @@ class GLUDReader:
                         if symbol in result['Sigma']:
                             # É um símbolo terminal
                             result['productions'].append((left, right))
-                            print(f"Adicionada produção terminal: {left} -> {right}")
+                            if verbose:
+                                print(f"Adicionada produção terminal: {left} -> {right}")
                         elif symbol in result['V']:
                             # É um não-terminal (produção unitária)
                             result['productions'].append((left, right))
-                            print(f"Adicionada produção unitária: {left} -> {right}")
+                            if verbose:
+                                print(f"Adicionada produção unitária: {left} -> {right}")
                         else:
                             print(f"Produção inválida: {left} -> {right}")
                             print(f"  '{symbol}' não é terminal nem não-terminal")
@@ -0,0 +1,142 @@
+EPSILON = 'ε'
+
+
+class RegexParser:
+    """
+    Analisador de expressões regulares para a construção de Glushkov.
+
+    Sintaxe suportada:
+        ab      concatenação
+        a|b     alternância
+        a* a+ a?  fecho de Kleene, fecho positivo e opcional
+        (a)     agrupamento
+        [abc] [a-z]  classes de caracteres (com intervalos)
+        ε       cadeia vazia
+        \\c     escape de um caractere especial
+
+    A árvore sintática usa nós n-ários para alternância e concatenação, de modo
+    que padrões com milhares de alternativas não aprofundam a recursão:
+        ('sym', posição), ('eps',), ('alt', [filhos]), ('cat', [filhos]),
+        ('star', filho), ('plus', filho), ('opt', filho)
+    Cada ocorrência de símbolo recebe uma posição (1..n); ``positions[p - 1]``
+    é o símbolo lido na posição ``p``.
+    """
+
+    def __init__(self, pattern: str, alphabet=None):
+        self.pattern = pattern
+        self.alphabet = set(alphabet) if alphabet is not None else None
+        self.pos = 0
+        self.positions = []
+
+    def parse(self) -> dict:
+        """
+        Analisa o padrão.
+
+        Returns:
+            dict: {'pattern', 'Sigma', 'positions', 'ast'}
+        """
+        self.pos = 0
+        self.positions = []
+        ast = self._parse_alternation()
+        if self.pos < len(self.pattern):
+            raise ValueError(
+                f"Caractere inesperado '{self.pattern[self.pos]}' na posição {self.pos} da expressão."
+            )
+
+        Sigma = set(self.positions)
+        if self.alphabet is not None:
+            unknown = Sigma - self.alphabet
+            if unknown:
+                raise ValueError(f"Símbolos fora do alfabeto: {', '.join(sorted(unknown))}")
+            Sigma = self.alphabet
+
+        return {
+            'pattern': self.pattern,
+            'Sigma': sorted(Sigma),
+            'positions': self.positions,
+            'ast': ast,
+        }
+
+    def _peek(self):
+        return self.pattern[self.pos] if self.pos < len(self.pattern) else None
+
+    def _parse_alternation(self):
+        branches = [self._parse_concatenation()]
+        while self._peek() == '|':
+            self.pos += 1
+            branches.append(self._parse_concatenation())
+        return branches[0] if len(branches) == 1 else ('alt', branches)
+
+    def _parse_concatenation(self):
+        factors = []
+        while self._peek() is not None and self._peek() not in '|)':
+            factors.append(self._parse_repetition())
+        if not factors:
+            return ('eps',)
+        return factors[0] if len(factors) == 1 else ('cat', factors)
+
+    def _parse_repetition(self):
+        node = self._parse_atom()
+        while self._peek() in ('*', '+', '?'):
+            operator = self.pattern[self.pos]
+            self.pos += 1
+            node = ({'*': 'star', '+': 'plus', '?': 'opt'}[operator], node)
+        return node
+
+    def _parse_atom(self):
+        char = self._peek()
+        if char == '(':
+            self.pos += 1
+            node = self._parse_alternation()
+            if self._peek() != ')':
+                raise ValueError(f"Parêntese não fechado na expressão '{self.pattern}'.")
+            self.pos += 1
+            return node
+        if char == '[':
+            return self._parse_class()
+        if char == EPSILON:
+            self.pos += 1
+            return ('eps',)
+        if char in ('*', '+', '?', ')', ']'):
+            raise ValueError(f"Operador '{char}' sem operando na posição {self.pos} da expressão.")
+        if char == '\\':
+            self.pos += 1
+            char = self._peek()
+            if char is None:
+                raise ValueError("Escape incompleto no final da expressão.")
+        self.pos += 1
+        return self._symbol(char)
+
+    def _parse_class(self):
+        self.pos += 1  # '['
+        symbols = []
+        while self._peek() != ']':
+            char = self._peek()
+            if char is None:
+                raise ValueError(f"Classe de caracteres não fechada na expressão '{self.pattern}'.")
+            if char == '\\':
+                self.pos += 1
+                char = self._peek()
+                if char is None:
+                    raise ValueError("Escape incompleto no final da expressão.")
+            self.pos += 1
+            if self._peek() == '-' and self.pos + 1 < len(self.pattern) and self.pattern[self.pos + 1] != ']':
+                end = self.pattern[self.pos + 1]
+                self.pos += 2
+                if ord(end) < ord(char):
+                    raise ValueError(f"Intervalo inválido '{char}-{end}' na expressão.")
+                symbols.extend(chr(c) for c in range(ord(char), ord(end) + 1))
+            else:
+                symbols.append(char)
+        self.pos += 1  # ']'
+
+        # Símbolos repetidos na classe não geram posições duplicadas
+        unique = list(dict.fromkeys(symbols))
+        if not unique:
+            raise ValueError(f"Classe de caracteres vazia na expressão '{self.pattern}'.")
+        nodes = [self._symbol(symbol) for symbol in unique]
+        return nodes[0] if len(nodes) == 1 else ('alt', nodes)
+
+    def _symbol(self, char):
+        self.positions.append(char)
+        return ('sym', len(self.positions))
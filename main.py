@@ -1,12 +1,91 @@
 import os
 import sys
-from grammar.glud_reader import GLUDReader
-from automata.converter import Converter
-from utils.file_operations import FileOperations
 from utils.cli import CLI
 
+# Os módulos de gramática, conversão e arquivos são importados sob demanda:
+# o subcomando 'check' carrega apenas o núcleo de simulação.
 
 grammar_file_path = './grammar/glud.txt'
+artifact_file_path = os.path.join('output', 'automato.afd')
+
+def check(args):
+    """
+    Subcomando 'check': testa cadeias em um autômato pré-compilado.
+    Retorna o código de saída (0 se todas forem aceitas, 1 caso contrário).
+    """
+    options = CLI.parse_check_args(args)
+    if options is None:
+        CLI.display_help()
+        return 2
+    
+    from automata.artifact import load_afd
+    
+    try:
+        afd = load_afd(options['artifact'])
+    except (OSError, ValueError) as e:
+        print(f"Erro ao carregar o autômato: {e}", file=sys.stderr)
+        return 2
+    
+    strings = options['strings']
+    if strings is None:
+        # Sem cadeias nos argumentos: uma cadeia por linha na entrada padrão
+        strings = (line.rstrip('\n') for line in sys.stdin)
+    
+    all_accepted = True
+    for input_string in strings:
+        is_accepted = afd.simulate(input_string, verbose=options['verbose'])
+        all_accepted = all_accepted and is_accepted
+        if not options['quiet']:
+            CLI.display_check_result(input_string, is_accepted)
+    return 0 if all_accepted else 1
+
+def compile_automaton(args):
+    """
+    Subcomando 'compile': lê a gramática (ou expressão regular), determiniza
+    e grava o AFD compilado para uso com 'check'.
+    """
+    options = CLI.parse_compile_args(args)
+    if options is None:
+        CLI.display_help()
+        return 2
+    
+    from automata.converter import Converter
+    from automata.artifact import save_afd
+    
+    try:
+        converter = Converter({})
+        if options['regex'] is not None:
+            from grammar.regex_parser import RegexParser
+            afn = converter.convert_regex_to_afn(RegexParser(options['regex']).parse())
+        else:
+            from grammar.glud_reader import GLUDReader
+            grammar = GLUDReader(options['grammar'] or grammar_file_path).parse(verbose=False)
+            afn = Converter(grammar).convert_glud_to_afn(verbose=False)
+        afd = converter.convert_afn_to_afd(afn, verbose=False)
+    except ValueError as e:
+        print(f"Erro ao ler a gramática: {e}", file=sys.stderr)
+        return 2
+    except FileNotFoundError:
+        print("Arquivo de gramática não encontrado.", file=sys.stderr)
+        return 2
+    
+    output_path = options['output'] or artifact_file_path
+    output_dir = os.path.dirname(output_path)
+    if output_dir:
+        os.makedirs(output_dir, exist_ok=True)
+    save_afd(afd, output_path)
+    print(f"AFD compilado ({len(afd.states)} estados) salvo em: {output_path}")
+    
+    if options['exports']:
+        from utils.file_operations import FileOperations
+        for export_path in options['exports']:
+            try:
+                FileOperations.export_automaton(afd, export_path, options['max_states'])
+            except (OSError, ValueError) as e:
+                print(f"Erro ao exportar o autômato: {e}", file=sys.stderr)
+                return 2
+            print(f"AFD exportado em: {export_path}")
+    return 0
 
 def main():
     # Verificar se o usuário solicitou ajuda
@@ -14,6 +93,19 @@ def main():
         CLI.display_help()
         return
     
+    # Subcomandos
+    if len(sys.argv) > 1 and sys.argv[1] == 'check':
+        sys.exit(check(sys.argv[2:]))
+    if len(sys.argv) > 1 and sys.argv[1] == 'compile':
+        sys.exit(compile_automaton(sys.argv[2:]))
+    if len(sys.argv) > 1 and sys.argv[1] == 'differential':
+        from utils.differential import main as differential
+        sys.exit(differential(sys.argv[2:]))
+    
+    from grammar.glud_reader import GLUDReader
+    from automata.converter import Converter
+    from utils.file_operations import FileOperations
+    
     try:
         reader = GLUDReader(grammar_file_path)
         grammar = reader.parse()
@@ -74,19 +74,104 @@ class CLI:
         choice = input("Simulação detalhada? (s/N): ").lower().strip()
         return choice.startswith('s')
     
+    @staticmethod
+    def display_check_result(input_string: str, is_accepted: bool):
+        """
+        Exibe o resultado de uma cadeia testada pelo subcomando 'check'.
+        """
+        cadeia = "ε" if input_string == "" else input_string
+        print(f"{cadeia}: {'Aceita' if is_accepted else 'Rejeitada'}")
+    
+    @staticmethod
+    def parse_check_args(args):
+        """
+        Interpreta os argumentos de 'check ARQUIVO [-v] [-q] [cadeia ...]'.
+        
+        Returns:
+            dict: {'artifact', 'strings', 'verbose', 'quiet'} ou None se inválidos.
+            'strings' é None quando as cadeias devem ser lidas da entrada padrão.
+        """
+        options = {'artifact': None, 'strings': None, 'verbose': False, 'quiet': False}
+        positional = []
+        for arg in args:
+            if arg in ['-v', '--verbose']:
+                options['verbose'] = True
+            elif arg in ['-q', '--quiet']:
+                options['quiet'] = True
+            else:
+                positional.append(arg)
+        if not positional:
+            return None
+        options['artifact'] = positional[0]
+        if len(positional) > 1:
+            options['strings'] = positional[1:]
+        return options
+    
+    @staticmethod
+    def parse_compile_args(args):
+        """
+        Interpreta os argumentos de
+        'compile [GRAMATICA | --regex PADRAO] [-o ARQUIVO] [--export ARQUIVO ...] [--max-states N]'.
+        
+        Returns:
+            dict: {'grammar', 'regex', 'output', 'exports', 'max_states'} ou None se inválidos.
+        """
+        options = {'grammar': None, 'regex': None, 'output': None, 'exports': [], 'max_states': None}
+        args = list(args)
+        while args:
+            arg = args.pop(0)
+            if arg in ['-o', '--output', '--regex', '--export', '--max-states']:
+                if not args:
+                    return None
+                value = args.pop(0)
+                if arg == '--export':
+                    options['exports'].append(value)
+                elif arg == '--max-states':
+                    if not value.isdigit():
+                        return None
+                    options['max_states'] = int(value)
+                else:
+                    options['regex' if arg == '--regex' else 'output'] = value
+            elif options['grammar'] is None:
+                options['grammar'] = arg
+            else:
+                return None
+        if options['grammar'] is not None and options['regex'] is not None:
+            return None
+        return options
+    
     @staticmethod
     def display_help():
         """
         Exibe informações de ajuda sobre como usar o programa.
         """
         print("Uso: python main.py [cadeia]")
+        print("     python main.py compile [GRAMATICA | --regex PADRAO] [-o ARQUIVO]")
+        print("                            [--export ARQUIVO ...] [--max-states N]")
+        print("     python main.py check ARQUIVO [-v] [-q] [cadeia ...]")
+        print("     python main.py differential [--grammars N] [--strings N] [--seed S]")
         print("")
         print("Argumentos:")
         print("  cadeia    Cadeia opcional a ser testada (ex: 'abaaab')")
         print("")
         print("Se nenhuma cadeia for fornecida, será solicitada interativamente.")
         print("")
+        print("Subcomandos:")
+        print("  compile   Determiniza a gramática (padrão: grammar/glud.txt) ou a expressão")
+        print("            regular e grava o AFD compilado (padrão: output/automato.afd)")
+        print("            --export  exporta o AFD em .dot, .jsonl ou .json (pode repetir)")
+        print("            --max-states  acima desse número de estados, exporta um resumo")
+        print("  check     Testa cadeias no AFD compilado, sem refazer a conversão nem gerar")
+        print("            arquivos; sem cadeias nos argumentos, lê uma por linha da entrada")
+        print("            padrão. Código de saída 0 se todas forem aceitas, 1 caso contrário")
+        print("            -v  exibe a simulação passo a passo; -q  não exibe os resultados")
+        print("  differential  Gera gramáticas e cadeias aleatórias e confere que todos os")
+        print("            motores de simulação concordam, medindo a vazão de cada um")
+        print("")
         print("Exemplos:")
         print("  python main.py abaaab")
         print("  python main.py \"\"  # cadeia vazia")
-        print("  python main.py       # modo interativo")
\ No newline at end of file
+        print("  python main.py       # modo interativo")
+        print("  python main.py compile -o output/automato.afd")
+        print("  python main.py compile --export output/AFD.dot --max-states 500")
+        print("  python main.py check output/automato.afd abaa ab")
\ No newline at end of file
@@ -0,0 +1,485 @@
+import os
+import random
+import re
+import sys
+import tempfile
+import time
+from typing import Callable, Dict, List, Optional
+
+from automata.artifact import read_afd, layout, write_afd
+from automata.converter import Converter
+from automata.lexer import Lexer
+from automata.parallel import chunk_mapping, prefix_scan
+from automata.scanner import Scanner
+from automata.shared import SharedAFD
+from grammar.glud_reader import GLUDReader
+from grammar.regex_parser import RegexParser
+
+
+class DifferentialTester:
+    """
+    Teste diferencial baseado em propriedades entre os motores de simulação.
+
+    Para cada gramática GLUD aleatória (escrita em arquivo e lida pelo
+    ``GLUDReader``), gera cadeias aleatórias e cadeias aceitas (via
+    ``AFD.enumerate``) e verifica que todos os motores concordam com a
+    simulação direta por conjuntos no AFN, que serve de referência:
+
+        afd                    AFD.simulate_quiet
+        complemento            negação do AFD de apply_complement
+        reverso                AFD de apply_reverse sobre a cadeia invertida
+        artefato               AFD lido do formato binário pré-compilado
+        memoria_compartilhada  AFD anexado via SharedAFD
+        paralelo               mapeamentos por bloco + varredura de prefixos
+        paralelo_longo         o mesmo, com blocos de até 64 símbolos sobre
+                               cadeias longas que percorrem estados vivos
+        paralelo_processos     AFD.simulate_parallel (2 processos) sobre essas
+                               cadeias longas
+        multipadrao            AFD combinado com outra gramática (tag do padrão)
+        busca                  Scanner.scan: fins de ocorrência em textos
+                               formados pelas cadeias, contra a força bruta
+                               por substrings no AFN
+        busca_arquivo          Scanner.scan_file com blocos pequenos e 2
+                               processos (estado de entrada de cada bloco)
+        regex                  AFN de Glushkov de uma expressão aleatória
+                               (e seu AFD) contra ``re.fullmatch``
+
+    Também confere ``AFD.count_strings`` contra a contagem por força bruta e o
+    ``Lexer`` contra o casamento mais longo por força bruta nos AFNs, além de
+    contar os símbolos lidos pelo ``Lexer`` na entrada ``a^n`` com as regras
+    ``a`` e ``a*b`` (que obriga a reler a entrada e é quadrática sem a
+    memória de falhas).
+    A vazão de cada motor (cadeias/s e símbolos/s) é medida sobre as mesmas
+    cadeias, de modo que correção e desempenho são avaliados juntos.
+    """
+
+    REFERENCE = 'afn'
+
+    def __init__(self, seed: Optional[int] = None, alphabet: str = 'abc',
+                 max_nonterminals: int = 5, max_length: int = 12):
+        self.random = random.Random(seed)
+        self.alphabet = alphabet
+        self.max_nonterminals = max_nonterminals
+        self.max_length = max_length
+        self.converter = Converter({})
+        self.checks: Dict[str, int] = {}
+        self.mismatches: Dict[str, int] = {}
+        self.elapsed: Dict[str, float] = {}
+        self.symbols: Dict[str, int] = {}
+        self.failures: List[dict] = []
+
+    def random_grammar_text(self) -> str:
+        """Gera o texto de uma gramática GLUD aleatória no formato do GLUDReader."""
+        count = self.random.randint(1, self.max_nonterminals)
+        V = ['S'] + [chr(ord('A') + i) for i in range(count - 1)]
+        Sigma = sorted(self.random.sample(self.alphabet, self.random.randint(1, len(self.alphabet))))
+
+        lines = [f"G = ({{{', '.join(V)}}}, {{{', '.join(Sigma)}}}, P, S)"]
+        for left in V:
+            alternatives = set()
+            for _ in range(self.random.randint(1, 4)):
+                kind = self.random.random()
+                if kind < 0.15:
+                    alternatives.add('ε')
+                elif kind < 0.35:
+                    alternatives.add(self.random.choice(Sigma))
+                elif kind < 0.45:
+                    alternatives.add(self.random.choice(V))
+                else:
+                    alternatives.add(self.random.choice(Sigma) + self.random.choice(V))
+            lines.append(f"{left} -> {' | '.join(sorted(alternatives))}")
+        return "\n".join(lines) + "\n"
+
+    def build(self, text: str):
+        """Lê a gramática pelo GLUDReader e constrói AFN e AFD sem prints."""
+        fd, path = tempfile.mkstemp(suffix='.txt', text=True)
+        try:
+            with os.fdopen(fd, 'w', encoding='utf-8') as f:
+                f.write(text)
+            grammar = GLUDReader(path).parse(verbose=False)
+        finally:
+            os.remove(path)
+        afn = Converter(grammar).convert_glud_to_afn(verbose=False)
+        afd = self.converter.convert_afn_to_afd(afn, verbose=False)
+        return afn, afd
+
+    def random_strings(self, afd, count: int) -> List[str]:
+        """Metade cadeias aleatórias sobre o alfabeto, metade cadeias aceitas."""
+        symbols = afd.symbols
+        strings = [
+            ''.join(self.random.choice(symbols) for _ in range(self.random.randint(0, self.max_length)))
+            for _ in range(count - count // 2)
+        ]
+        accepted = []
+        for string in afd.enumerate(self.max_length):
+            accepted.append(string)
+            if len(accepted) >= 50 * count:
+                break
+        if accepted:
+            strings.extend(self.random.choice(accepted) for _ in range(count // 2))
+        return strings
+
+    def engines(self, afn, afd, other_afn, resources: list) -> Dict[str, Callable[[str], bool]]:
+        """Motores a comparar; ``resources`` recebe o que deve ser fechado depois."""
+        complement = afd.apply_complement()
+        reverse = afd.apply_reverse(verbose=False)
+
+        _, _, _, size = layout(afd)
+        buffer = bytearray(size)
+        write_afd(buffer, afd)
+        loaded = read_afd(bytes(buffer))
+
+        shared = SharedAFD.create(afd)
+        resources.append(shared)
+        attached = SharedAFD.attach(shared.name)
+        resources.append(attached)
+
+        multi = self.converter.convert_patterns_to_afd([afn, other_afn])
+
+        def parallel(string):
+            # Blocos de tamanho aleatório: de um símbolo até a cadeia inteira
+            size = self.random.randint(1, len(string) + 1)
+            chunks = [string[i:i + size] for i in range(0, len(string), size)]
+            state = prefix_scan([chunk_mapping(afd, chunk) for chunk in chunks], afd.start)[-1]
+            return state != len(afd.states) and bool(afd.finals[state])
+
+        return {
+            'afn': afn.simulate_quiet,
+            'afd': afd.simulate_quiet,
+            'complemento': lambda string: not complement.simulate_quiet(string),
+            'reverso': lambda string: reverse.simulate_quiet(string[::-1]),
+            'artefato': loaded.simulate_quiet,
+            'memoria_compartilhada': attached.afd.simulate_quiet,
+            'paralelo': parallel,
+            'multipadrao': lambda string: 0 in multi.match(string),
+        }
+
+    def check_grammar(self, text: str, other_text: str, strings_per_grammar: int):
+        afn, afd = self.build(text)
+        other_afn, _ = self.build(other_text)
+        strings = self.random_strings(afd, strings_per_grammar)
+        total_symbols = sum(len(string) for string in strings)
+
+        resources = []
+        try:
+            engines = self.engines(afn, afd, other_afn, resources)
+            results = {}
+            for name, engine in engines.items():
+                start = time.perf_counter()
+                results[name] = [engine(string) for string in strings]
+                self.elapsed[name] = self.elapsed.get(name, 0.0) + time.perf_counter() - start
+                self.symbols[name] = self.symbols.get(name, 0) + total_symbols
+        finally:
+            # Anexados primeiro, criador por último (remove o bloco)
+            for resource in reversed(resources):
+                resource.close()
+
+        expected = results[self.REFERENCE]
+        for name, outcome in results.items():
+            if name == self.REFERENCE:
+                continue
+            self.checks[name] = self.checks.get(name, 0) + len(strings)
+            for string, want, got in zip(strings, expected, outcome):
+                if want != got:
+                    self.mismatches[name] = self.mismatches.get(name, 0) + 1
+                    self.failures.append({'engine': name, 'grammar': text, 'string': string,
+                                          'expected': want, 'got': got})
+
+        self.check_parallel(text, afn, afd)
+        self.check_scanner(text, afn, afd, strings)
+        self.check_regex(strings_per_grammar)
+        self.check_counts(text, afn, afd)
+        self.check_lexer(text, afn, other_afn, strings)
+
+    def random_walk(self, afd, length: int) -> str:
+        """
+        Cadeia longa que percorre o AFD só por estados vivos (dos quais algum
+        final é alcançável), para que a simulação por blocos não caia logo no
+        sumidouro; às vezes termina com alguns símbolos quaisquer.
+        """
+        distance = afd.distance_to_final()
+        k = len(afd.symbols)
+        state = afd.start
+        symbols = []
+        for _ in range(length):
+            choices = [a for a in range(k) if afd.table[state * k + a] >= 0
+                       and distance[afd.table[state * k + a]] >= 0]
+            if not choices:
+                break
+            a = self.random.choice(choices)
+            symbols.append(afd.symbols[a])
+            state = afd.table[state * k + a]
+        if k and self.random.random() < 0.5:
+            symbols.extend(self.random.choice(afd.symbols) for _ in range(self.random.randint(1, 8)))
+        return ''.join(symbols)
+
+    def check_parallel(self, text: str, afn, afd, inputs: int = 2, length: int = 2000,
+                       max_chunk_size: int = 64):
+        """
+        Confere os mapeamentos por bloco e AFD.simulate_parallel (2 processos)
+        com blocos pequenos de tamanho aleatório sobre cadeias longas.
+        """
+        for _ in range(inputs):
+            source = self.random_walk(afd, length)
+            chunk_size = self.random.randint(1, max_chunk_size)
+            expected = afn.simulate_quiet(source)
+
+            def chunked(string):
+                chunks = [string[i:i + chunk_size] for i in range(0, len(string), chunk_size)]
+                state = prefix_scan([chunk_mapping(afd, chunk) for chunk in chunks], afd.start)[-1]
+                return state != len(afd.states) and bool(afd.finals[state])
+
+            for name, engine in (
+                ('paralelo_longo', chunked),
+                ('paralelo_processos', lambda string: afd.simulate_parallel(
+                    string, processes=2, chunk_size=chunk_size)),
+            ):
+                start = time.perf_counter()
+                got = engine(source)
+                self.elapsed[name] = self.elapsed.get(name, 0.0) + time.perf_counter() - start
+                self.symbols[name] = self.symbols.get(name, 0) + len(source)
+                self.checks[name] = self.checks.get(name, 0) + 1
+                if expected != got:
+                    self.mismatches[name] = self.mismatches.get(name, 0) + 1
+                    self.failures.append({'engine': name, 'grammar': text,
+                                          'string': f"{source} (blocos de {chunk_size})",
+                                          'expected': expected, 'got': got})
+
+    def check_scanner(self, text: str, afn, afd, strings: List[str], inputs: int = 3,
+                      pieces: int = 6):
+        """
+        Confere os fins de ocorrência de Scanner.scan e Scanner.scan_file
+        (blocos pequenos, 2 processos) contra a força bruta: ``e`` é um fim
+        se alguma substring ``texto[s:e]`` é aceita pelo AFN.
+        """
+        scanner = Scanner(afd)
+        for _ in range(inputs):
+            source = ''.join(self.random.choice(strings) for _ in range(pieces))
+            expected = [end for end in range(len(source) + 1)
+                        if any(afn.simulate_quiet(source[begin:end]) for begin in range(end + 1))]
+            data = source.encode('latin-1')
+
+            fd, path = tempfile.mkstemp(suffix='.txt')
+            try:
+                with os.fdopen(fd, 'wb') as f:
+                    f.write(data)
+                chunk_size = self.random.randint(1, 8)
+                for name, engine in (
+                    ('busca', lambda: list(scanner.scan(data))),
+                    ('busca_arquivo', lambda: list(scanner.scan_file(
+                        path, chunk_size=chunk_size, processes=2))),
+                ):
+                    start = time.perf_counter()
+                    got = engine()
+                    self.elapsed[name] = self.elapsed.get(name, 0.0) + time.perf_counter() - start
+                    self.symbols[name] = self.symbols.get(name, 0) + len(source)
+                    self.checks[name] = self.checks.get(name, 0) + 1
+                    if expected != got:
+                        self.mismatches[name] = self.mismatches.get(name, 0) + 1
+                        self.failures.append({'engine': name, 'grammar': text, 'string': source,
+                                              'expected': expected, 'got': got})
+            finally:
+                os.remove(path)
+
+    def random_regex(self, depth: int = 4) -> str:
+        """Gera uma expressão regular aleatória na sintaxe comum ao RegexParser e ao ``re``."""
+        if depth == 0 or self.random.random() < 0.25:
+            if self.random.random() < 0.2:
+                return '[' + ''.join(sorted(self.random.sample(self.alphabet, 2))) + ']'
+            return self.random.choice(self.alphabet)
+        kind = self.random.random()
+        if kind < 0.35:
+            return self.random_regex(depth - 1) + self.random_regex(depth - 1)
+        if kind < 0.65:
+            return f"({self.random_regex(depth - 1)}|{self.random_regex(depth - 1)})"
+        return f"({self.random_regex(depth - 1)}){self.random.choice('*+?')}"
+
+    def check_regex(self, count: int):
+        """Confere o AFN de Glushkov (e o AFD dele) contra ``re.fullmatch``."""
+        name = 'regex'
+        pattern = self.random_regex()
+        afn = self.converter.convert_regex_to_afn(RegexParser(pattern, self.alphabet).parse())
+        afd = self.converter.convert_afn_to_afd(afn, verbose=False)
+        compiled = re.compile(pattern)
+        strings = [
+            ''.join(self.random.choice(self.alphabet) for _ in range(self.random.randint(0, self.max_length)))
+            for _ in range(count)
+        ]
+        start = time.perf_counter()
+        results = [(afn.simulate_quiet(string), afd.simulate_quiet(string)) for string in strings]
+        self.elapsed[name] = self.elapsed.get(name, 0.0) + time.perf_counter() - start
+        self.symbols[name] = self.symbols.get(name, 0) + sum(len(string) for string in strings)
+        self.checks[name] = self.checks.get(name, 0) + len(strings)
+        for string, got in zip(strings, results):
+            expected = compiled.fullmatch(string) is not None
+            if got != (expected, expected):
+                self.mismatches[name] = self.mismatches.get(name, 0) + 1
+                self.failures.append({'engine': name, 'grammar': pattern, 'string': string,
+                                      'expected': expected, 'got': got})
+
+    def check_counts(self, text: str, afn, afd, max_length: int = 5):
+        """Confere count_strings contra a força bruta no AFN."""
+        name = 'contagem'
+        words = ['']
+        for length in range(max_length + 1):
+            expected = sum(1 for word in words if afn.simulate_quiet(word))
+            got = afd.count_strings(length)
+            self.checks[name] = self.checks.get(name, 0) + 1
+            if expected != got:
+                self.mismatches[name] = self.mismatches.get(name, 0) + 1
+                self.failures.append({'engine': name, 'grammar': text, 'string': f"|w| = {length}",
+                                      'expected': expected, 'got': got})
+            words = [word + symbol for word in words for symbol in afd.symbols]
+
+    def check_lexer(self, text: str, afn, other_afn, strings: List[str], inputs: int = 20):
+        """Confere Lexer.tokenize contra o casamento mais longo por força bruta."""
+        name = 'lexico'
+        rules = [('P0', afn), ('P1', other_afn)]
+        lexer = Lexer(rules)
+        for _ in range(inputs):
+            source = ''.join(self.random.choice(strings) for _ in range(self.random.randint(1, 5)))
+            expected = _reference_tokens(rules, source)
+            start = time.perf_counter()
+            got = _tokens(lexer, source)
+            self.elapsed[name] = self.elapsed.get(name, 0.0) + time.perf_counter() - start
+            self.symbols[name] = self.symbols.get(name, 0) + len(source)
+            self.checks[name] = self.checks.get(name, 0) + 1
+            if expected != got:
+                self.mismatches[name] = self.mismatches.get(name, 0) + 1
+                self.failures.append({'engine': name, 'grammar': text, 'string': source,
+                                      'expected': expected, 'got': got})
+
+    def check_lexer_rescan(self, length: int = 16000, max_reads: int = 4):
+        """
+        Regressão do tempo linear do Lexer: com as regras ``a`` e ``a*b`` sobre
+        ``a^n`` cada lexema lê a entrada até o fim antes de recuar. Em vez do
+        tempo, conta os símbolos lidos pelo Lexer, que não podem passar de
+        ``max_reads * n`` (sem a memória de falhas seriam cerca de ``n² / 2``).
+        """
+        name = 'lexico_releitura'
+        lexer = Lexer([
+            ('A', self.converter.convert_regex_to_afn(RegexParser('a').parse())),
+            ('AB', self.converter.convert_regex_to_afn(RegexParser('a*b').parse())),
+        ])
+        source = _CountingText('a' * length)
+        start = time.perf_counter()
+        got = _tokens(lexer, source)
+        self.elapsed[name] = self.elapsed.get(name, 0.0) + time.perf_counter() - start
+        self.symbols[name] = self.symbols.get(name, 0) + length
+        self.checks[name] = self.checks.get(name, 0) + 2
+
+        grammar = "A -> a\nAB -> a*b"
+        if got != [('A', i, i + 1) for i in range(length)]:
+            self.mismatches[name] = self.mismatches.get(name, 0) + 1
+            self.failures.append({'engine': name, 'grammar': grammar,
+                                  'string': f"a^{length}", 'expected': f"A^{length}", 'got': got})
+        if source.reads > max_reads * length:
+            self.mismatches[name] = self.mismatches.get(name, 0) + 1
+            self.failures.append({'engine': name, 'grammar': grammar, 'string': f"a^{length}",
+                                  'expected': f"no máximo {max_reads * length} leituras",
+                                  'got': f"{source.reads} leituras"})
+
+    def run(self, grammars: int = 100, strings_per_grammar: int = 200) -> bool:
+        """Executa o teste diferencial. Retorna True se todos os motores concordam."""
+        for _ in range(grammars):
+            self.check_grammar(self.random_grammar_text(), self.random_grammar_text(),
+                               strings_per_grammar)
+        self.check_lexer_rescan()
+        return not self.failures
+
+    def report(self, max_failures: int = 5):
+        """Exibe o resumo por motor: verificações, divergências e vazão."""
+        print("\n" + "="*50)
+        print("TESTE DIFERENCIAL")
+        print("="*50)
+        print(f"| {'Motor':<22} | {'Verificações':>12} | {'Divergências':>12} | {'Cadeias/s':>10} | {'Símbolos/s':>11} |")
+        print("|" + "-" * 83 + "|")
+        names = list(self.elapsed) + [name for name in self.checks if name not in self.elapsed]
+        for name in names:
+            checks = '-' if name == self.REFERENCE else str(self.checks.get(name, 0))
+            mismatches = '-' if name == self.REFERENCE else str(self.mismatches.get(name, 0))
+            elapsed = self.elapsed.get(name)
+            if elapsed:
+                strings = self.checks.get(name, self.checks.get('afd', 0))
+                rate = f"{strings / elapsed:,.0f}"
+                symbol_rate = f"{self.symbols[name] / elapsed:,.0f}"
+            else:
+                rate = symbol_rate = '-'
+            print(f"| {name:<22} | {checks:>12} | {mismatches:>12} | {rate:>10} | {symbol_rate:>11} |")
+
+        if self.failures:
+            print(f"\n{len(self.failures)} divergência(s). Primeiras:")
+            for failure in self.failures[:max_failures]:
+                string = 'ε' if failure['string'] == '' else failure['string']
+                print(f"\n  Motor: {failure['engine']}  cadeia: {string}  "
+                      f"esperado: {failure['expected']}  obtido: {failure['got']}")
+                for line in failure['grammar'].splitlines():
+                    print(f"    {line}")
+        else:
+            print("\nTodos os motores concordam.")
+
+
+class _CountingText(str):
+    """Cadeia que conta os símbolos lidos por índice (``text[i]``)."""
+
+    reads = 0
+
+    def __getitem__(self, index):
+        if isinstance(index, int):
+            self.reads += 1
+        return super().__getitem__(index)
+
+
+def _tokens(lexer: Lexer, source: str) -> list:
+    """Tokens gerados pelo Lexer; um erro léxico encerra a lista com ``None``."""
+    tokens = []
+    try:
+        tokens.extend(lexer.tokenize(source))
+    except ValueError:
+        tokens.append(None)
+    return tokens
+
+
+def _reference_tokens(rules, source: str) -> list:
+    """Casamento mais longo por força bruta: testa todos os prefixos em cada AFN."""
+    tokens = []
+    position = 0
+    while position < len(source):
+        token = None
+        for end in range(len(source), position, -1):
+            for token_type, afn in rules:
+                if afn.simulate_quiet(source[position:end]):
+                    token = (token_type, position, end)
+                    break
+            if token:
+                break
+        if token is None:
+            tokens.append(None)
+            break
+        tokens.append(token)
+        position = token[2]
+    return tokens
+
+
+def main(args=None) -> int:
+    """
+    Uso: python -m utils.differential [--grammars N] [--strings N] [--seed S]
+    Código de saída 0 se todos os motores concordam, 1 caso contrário.
+    """
+    args = list(sys.argv[1:] if args is None else args)
+    options = {'--grammars': 100, '--strings': 200, '--seed': None}
+    while args:
+        arg = args.pop(0)
+        if arg not in options or not args or not args[0].lstrip('-').isdigit():
+            print(main.__doc__.strip().splitlines()[0])
+            return 2
+        options[arg] = int(args.pop(0))
+
+    tester = DifferentialTester(seed=options['--seed'])
+    ok = tester.run(options['--grammars'], options['--strings'])
+    tester.report()
+    return 0 if ok else 1
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -2,6 +2,7 @@ import os
 from automata.afn import AFN
 from automata.afd import AFD
 from automata.formatter import AutomataFormatter
+from automata.exporter import AutomataExporter
 
 
 class FileOperations:
@@ -24,4 +25,22 @@ class FileOperations:
     def write_afd_to_file(afd: AFD, filename: str, title="# AFD Determinizado"):
         """Escreve o AFD no formato especificado em um arquivo .txt."""
         with open(filename, 'w', encoding='utf-8') as f:
-            f.write(AutomataFormatter.format_afd(afd, title))
\ No newline at end of file
+            f.write(AutomataFormatter.format_afd(afd, title))
+
+    @staticmethod
+    def export_automaton(af, filename: str, max_states=None):
+        """
+        Exporta o autômato (AFN ou AFD) em fluxo, escolhendo o formato pela
+        extensão do arquivo: .dot (Graphviz), .jsonl (JSON-Lines) ou .json.
+        """
+        extension = os.path.splitext(filename)[1].lower()
+        exporters = {
+            '.dot': AutomataExporter.write_dot,
+            '.jsonl': AutomataExporter.write_jsonl,
+            '.json': AutomataExporter.write_json,
+        }
+        if extension not in exporters:
+            raise ValueError(f"Formato de exportação não suportado: '{extension}' (use .dot, .jsonl ou .json)")
+        options = {} if max_states is None else {'max_states': max_states}
+        with open(filename, 'w', encoding='utf-8') as f:
+            exporters[extension](af, f, **options)
\ No newline at end of file